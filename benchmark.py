@@ -0,0 +1,146 @@
+# Headless frame-time benchmark for every game in the hub menu:
+#   python benchmark.py [--frames N] [--output FILE] [--baseline FILE]
+# Each game runs a scripted bot for a fixed number of frames, restarting when
+# it ends. Peak memory comes from a second tracemalloc pass so it does not
+# skew the timings, and a third pass counts steady-state allocations and GC
+# runs. With --baseline, p95/FPS regressions and new GC runs exit with status 1.
+# --atlas instead times pygame.draw primitives against sprite atlas blits.
+import os, sys, json, time, random, tracemalloc, argparse
+
+os.environ["GAME_HUB_HEADLESS"] = "1"
+# Keep the pygame banner out of the results printed to stdout
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame
+import game_hub as hub
+
+# -------- Runner --------
+def percentiles(samples_ns):
+    ordered = sorted(samples_ns)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))] / 1e6
+    return {"p50": pick(0.50), "p95": pick(0.95), "p99": pick(0.99)}
+
+def play(game_cls, frames, seed, timed=True):
+    # Run `frames` frames, restarting the game whenever it ends
+    clock = time.perf_counter_ns
+    updates, draws = [], []
+    restarts = 0
+    game, bot = game_cls(seed), hub.make_bot(game_cls)
+    for tick in range(frames):
+        inp = bot(game, tick)
+        t0 = clock()
+        alive = game.step(inp)
+        t1 = clock()
+        game.draw(hub.screen)
+        t2 = clock()
+        if timed:
+            updates.append(t1 - t0)
+            draws.append(t2 - t1)
+        if not alive:
+            restarts += 1
+            game, bot = game_cls(seed + restarts), hub.make_bot(game_cls)
+    return updates, draws, restarts
+
+def bench_game(game_cls, frames, seed):
+    hub.text_cache.clear()
+    hub.hud_cache.clear()
+    updates, draws, restarts = play(game_cls, frames, seed)
+    total_s = (sum(updates) + sum(draws)) / 1e9
+    tracemalloc.start()
+    play(game_cls, frames, seed, timed=False)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    # Steady-state garbage: net blocks per tick and gen-0 GC runs, restarts excluded
+    allocations = hub.count_allocations(game_cls, frames, seed)
+    return {"frames": frames, "restarts": restarts,
+            "update_ms": percentiles(updates), "draw_ms": percentiles(draws),
+            "fps": frames / total_s if total_s else 0.0,
+            "peak_kb": peak / 1024,
+            "blocks_per_frame": allocations["blocks_per_frame"],
+            "gc_collections": allocations["gc_collections"]}
+
+def compare(results, baseline, tolerance, floor_ms=0.05):
+    # p95 changes under floor_ms are timer noise, not regressions
+    regressions = []
+    for name, now in results["games"].items():
+        before = baseline.get("games", {}).get(name)
+        if not before: continue
+        for phase in ("update_ms", "draw_ms"):
+            old, new = before[phase]["p95"], now[phase]["p95"]
+            if new > old * (1 + tolerance) and new - old > floor_ms:
+                regressions.append(f"{name}: {phase} p95 {old:.3f} -> {new:.3f}")
+        if now["fps"] < before["fps"] * (1 - tolerance):
+            regressions.append(f"{name}: fps {before['fps']:.0f} -> {now['fps']:.0f}")
+        if before.get("gc_collections") == 0 and now["gc_collections"]:
+            regressions.append(f"{name}: gen-0 GC runs 0 -> {now['gc_collections']}")
+    return regressions
+
+# -------- Atlas comparison --------
+ATLAS_SHAPES = [("rect", 20, 20), ("ellipse", 14, 14), ("spike", 30, 30), ("vline", 1, hub.HEIGHT)]
+
+def draw_primitive(surface, shape, x, y, w, h, color):
+    # The pygame.draw calls the games made before the atlas
+    if shape == "rect": pygame.draw.rect(surface, color, (x, y, w, h))
+    elif shape == "ellipse": pygame.draw.ellipse(surface, color, (x, y, w, h))
+    elif shape == "spike": pygame.draw.polygon(surface, color, [(x, y + h), (x + w // 2, y), (x + w, y + h)])
+    else: pygame.draw.aaline(surface, color, (x, y), (x, y + h))
+
+def compare_atlas(frames, count=200, seed=0):
+    # ms per frame to draw `count` copies of each shape both ways
+    rng = random.Random(seed)
+    color, surface, clock = (255, 255, 255), hub.screen, time.perf_counter
+    results = {}
+    for shape, w, h in ATLAS_SHAPES:
+        positions = [(rng.randrange(hub.WIDTH - w), rng.randrange(hub.HEIGHT - h + 1)) for _ in range(count)]
+        sprite = hub.atlas.get(shape, w, h, color)
+        t0 = clock()
+        for _ in range(frames):
+            for x, y in positions:
+                draw_primitive(surface, shape, x, y, w, h, color)
+        t1 = clock()
+        for _ in range(frames):
+            surface.blits([(sprite, pos) for pos in positions], doreturn=False)
+        t2 = clock()
+        draw_ms, atlas_ms = (t1 - t0) * 1000 / frames, (t2 - t1) * 1000 / frames
+        results[shape] = {"count": count, "draw_ms": draw_ms, "atlas_ms": atlas_ms,
+                          "speedup": draw_ms / atlas_ms if atlas_ms else 0.0}
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless per-game frame-time benchmark")
+    parser.add_argument("--frames", type=int, default=3000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--games", help="comma-separated menu labels (default: all)")
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    parser.add_argument("--baseline", help="JSON from a previous run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--atlas", action="store_true", help="compare primitive drawing with atlas blits")
+    args = parser.parse_args(argv)
+
+    if args.atlas:
+        print(json.dumps(compare_atlas(args.frames, seed=args.seed), indent=2))
+        return 0
+
+    wanted = set(args.games.split(",")) if args.games else None
+    results = {"frames": args.frames, "seed": args.seed, "python": sys.version.split()[0],
+               "pygame": pygame.version.ver, "games": {}}
+    for name, _, game_cls in hub.GAMES:
+        if wanted and name not in wanted: continue
+        results["games"][name] = bench_game(game_cls, args.frames, args.seed)
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for line in regressions:
+            print("REGRESSION", line, file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,266 @@
+# Gym-style environments over the hub games, for training and testing bots:
+#   env = SnakeEnv(); obs = env.reset(seed=0)
+#   obs, reward, done, info = env.step(action)
+# Actions index env.ACTIONS; observations are array("d") feature vectors and
+# nothing is drawn. VecEnv steps N copies in lockstep into shared arrays,
+# ProcessVecEnv splits them across worker processes. Throughput check:
+#   python envs.py [--env snake] [--envs 64] [--workers N] [--steps 1000000]
+import os, sys, time, random, argparse
+import multiprocessing as mp
+from array import array
+from collections import deque
+
+os.environ["GAME_HUB_HEADLESS"] = "1"
+# Keep the pygame banner out of the results printed to stdout
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame
+import game_hub as hub
+
+WIDTH, HEIGHT = hub.WIDTH, hub.HEIGHT
+DEATH_PENALTY = -1.0
+
+class GameEnv:
+    GAME = None
+    ACTIONS = (hub.IDLE,)
+    OBS_SIZE = 0
+
+    def __init__(self, max_steps=None, **options):
+        # `options` go to the game constructor; max_steps truncates episodes
+        self.max_steps = max_steps
+        self.options = options
+        self.game = None
+
+    def reset(self, seed=None):
+        self.game = self.GAME(seed, **self.options)
+        self.score = self.game.score
+        self.steps = 0
+        return self.observation()
+
+    def step(self, action):
+        game = self.game
+        alive = game.step(self.ACTIONS[action])
+        reward = game.score - self.score
+        self.score = game.score
+        self.steps += 1
+        truncated = alive and self.steps == self.max_steps
+        if not alive:
+            reward += DEATH_PENALTY
+        return self.observation(), reward, not alive or truncated, {"score": game.score, "truncated": truncated}
+
+    def observation(self):
+        return array("d")
+
+class SnakeEnv(GameEnv):
+    GAME = hub.Snake
+    ACTIONS = (hub.IDLE, hub.key_press(pygame.K_UP), hub.key_press(pygame.K_DOWN),
+               hub.key_press(pygame.K_LEFT), hub.key_press(pygame.K_RIGHT))
+    OBS_SIZE = 11
+
+    def observation(self):
+        # Head, apple offset, heading, walls/body next to the head, length
+        game = self.game
+        cols, rows, occupied = game.cols, game.rows, game.occupied
+        y, x = divmod(game.snake[0], cols)
+        ay, ax = divmod(game.apple, cols) if game.apple is not None else (y, x)
+
+        def blocked(dx, dy):
+            nx, ny = x + dx, y + dy
+            return 1.0 if not (0 <= nx < cols and 0 <= ny < rows) or occupied[ny * cols + nx] else 0.0
+
+        return array("d", (x / cols, y / rows, (ax - x) / cols, (ay - y) / rows, *game.direction,
+                           blocked(0, -1), blocked(0, 1), blocked(-1, 0), blocked(1, 0),
+                           len(game.snake) / (cols * rows)))
+
+class FlappyEnv(GameEnv):
+    GAME = hub.Flappy
+    ACTIONS = (hub.IDLE, hub.key_press(pygame.K_SPACE))
+    OBS_SIZE = 5
+
+    def observation(self):
+        # Bird height and velocity, then the next pipe pair's distance and gap
+        game = self.game
+        bird, pipes = game.bird, game.pipes
+        pipe_x, gap_top, gap_bottom = 1.0, 0.0, 1.0
+        for i in range(0, len(pipes) - 1, 2):
+            top, bottom = pipes[i], pipes[i + 1]
+            if top.right > bird.left:
+                pipe_x, gap_top, gap_bottom = (top.x - bird.x) / WIDTH, top.bottom / HEIGHT, bottom.top / HEIGHT
+                break
+        return array("d", (bird.y / HEIGHT, game.gravity / 25, pipe_x, gap_top, gap_bottom))
+
+class DodgeEnv(GameEnv):
+    GAME = hub.Dodge
+    ACTIONS = (hub.IDLE, hub.key_hold(pygame.K_LEFT), hub.key_hold(pygame.K_RIGHT))
+    NEAREST = 5
+    OBS_SIZE = 1 + 2 * NEAREST
+
+    def observation(self):
+        # Player x, then the NEAREST lowest blocks (the front of the ring)
+        game = self.game
+        blocks = game.blocks
+        xs, bases, offset = blocks.xs, blocks.bases, blocks.offset
+        mask = len(xs) - 1
+        obs = array("d", (game.player.x / WIDTH,))
+        for k in range(self.NEAREST):
+            if k < blocks.count:
+                i = (blocks.head + k) & mask
+                obs.extend((xs[i] / WIDTH, (bases[i] + offset) / HEIGHT))
+            else:
+                obs.extend((0.0, -1.0))
+        return obs
+
+class BreakoutEnv(GameEnv):
+    GAME = hub.Breakout
+    ACTIONS = (hub.IDLE, hub.key_hold(pygame.K_LEFT), hub.key_hold(pygame.K_RIGHT))
+    OBS_SIZE = 6
+
+    def observation(self):
+        game = self.game
+        ball = game.ball
+        return array("d", (game.paddle.centerx / WIDTH, ball.centerx / WIDTH, ball.centery / HEIGHT,
+                           game.dx / 4, game.dy / 4, game.bricks_left / (game.cols * game.rows)))
+
+ENVS = {"snake": SnakeEnv, "flappy": FlappyEnv, "dodge": DodgeEnv, "breakout": BreakoutEnv}
+
+# -------- Vectorized --------
+class VecEnv:
+    # N environments stepped in lockstep. Observations, rewards and done flags
+    # are flat arrays reused every step (obs[i * OBS_SIZE:(i + 1) * OBS_SIZE]
+    # is env i). Finished episodes reset on the spot, so obs then holds the
+    # first observation of the next one; their scores go to `returns`.
+    def __init__(self, env_cls, n, seed=0, **options):
+        self.allocate(env_cls, n)
+        self.envs = [env_cls(**options) for _ in range(n)]
+        self.seeds = random.Random(seed)
+
+    def allocate(self, env_cls, n):
+        self.n = n
+        self.obs_size = env_cls.OBS_SIZE
+        self.num_actions = len(env_cls.ACTIONS)
+        self.obs = array("d", bytes(8 * n * self.obs_size))
+        self.rewards = array("d", bytes(8 * n))
+        self.dones = bytearray(n)
+        self.returns = deque(maxlen=1000)
+
+    def __len__(self):
+        return self.n
+
+    def reset_env(self, i):
+        k = self.obs_size
+        self.obs[i * k:(i + 1) * k] = self.envs[i].reset(self.seeds.randrange(1 << 32))
+
+    def reset(self):
+        for i in range(len(self.envs)):
+            self.reset_env(i)
+        return self.obs
+
+    def step(self, actions):
+        obs, rewards, dones, k = self.obs, self.rewards, self.dones, self.obs_size
+        for i, env in enumerate(self.envs):
+            ob, reward, done, info = env.step(actions[i])
+            rewards[i] = reward
+            dones[i] = done
+            if done:
+                self.returns.append(info["score"])
+                self.reset_env(i)
+            else:
+                obs[i * k:(i + 1) * k] = ob
+        return obs, rewards, dones
+
+    def close(self):
+        pass
+
+def vec_worker(conn, env_name, n, seed, options):
+    vec = VecEnv(ENVS[env_name], n, seed, **options)
+    while True:
+        command, data = conn.recv()
+        if command == "step":
+            conn.send(vec.step(data) + (list(vec.returns),))
+            vec.returns.clear()
+        elif command == "reset":
+            conn.send(vec.reset())
+        else:
+            conn.close()
+            return
+
+class ProcessVecEnv(VecEnv):
+    # VecEnv split across worker processes, each owning a contiguous slice of
+    # the environments. step() sends every worker its actions before waiting
+    # on any, so the slices run in parallel.
+    def __init__(self, env_name, n, workers=None, seed=0, **options):
+        self.allocate(ENVS[env_name], n)
+        workers = max(1, min(n, workers or os.cpu_count() or 1))
+        self.slices, self.conns, self.procs = [], [], []
+        for w in range(workers):
+            lo, hi = n * w // workers, n * (w + 1) // workers
+            parent, child = mp.Pipe()
+            # String seeds give each worker its own deterministic seed stream
+            proc = mp.Process(target=vec_worker, args=(child, env_name, hi - lo, f"{seed}/{w}", options), daemon=True)
+            proc.start()
+            child.close()
+            self.slices.append((lo, hi))
+            self.conns.append(parent)
+            self.procs.append(proc)
+
+    def reset(self):
+        k = self.obs_size
+        for conn in self.conns:
+            conn.send(("reset", None))
+        for (lo, hi), conn in zip(self.slices, self.conns):
+            self.obs[lo * k:hi * k] = conn.recv()
+        return self.obs
+
+    def step(self, actions):
+        k = self.obs_size
+        for (lo, hi), conn in zip(self.slices, self.conns):
+            conn.send(("step", bytes(actions[lo:hi])))
+        for (lo, hi), conn in zip(self.slices, self.conns):
+            obs, rewards, dones, returns = conn.recv()
+            self.obs[lo * k:hi * k] = obs
+            self.rewards[lo:hi] = rewards
+            self.dones[lo:hi] = dones
+            self.returns.extend(returns)
+        return self.obs, self.rewards, self.dones
+
+    def close(self):
+        for conn in self.conns:
+            conn.send(("close", None))
+            conn.close()
+        for proc in self.procs:
+            proc.join()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Random-policy throughput of the vectorized environments")
+    parser.add_argument("--env", choices=sorted(ENVS), default="snake")
+    parser.add_argument("--envs", type=int, default=64, help="environments stepped in lockstep")
+    parser.add_argument("--workers", type=int, default=0, help="worker processes (0: in-process)")
+    parser.add_argument("--steps", type=int, default=1_000_000, help="total environment steps")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.workers:
+        vec = ProcessVecEnv(args.env, args.envs, args.workers, seed=args.seed)
+    else:
+        vec = VecEnv(ENVS[args.env], args.envs, seed=args.seed)
+    rng = random.Random(args.seed)
+    # Random actions, drawn up front so the policy is not what gets timed
+    batches = [bytes(rng.randrange(vec.num_actions) for _ in range(args.envs)) for _ in range(64)]
+    vec.reset()
+    rounds = max(1, args.steps // args.envs)
+    episodes, total = 0, 0.0
+    start = time.perf_counter()
+    for r in range(rounds):
+        vec.step(batches[r % len(batches)])
+        episodes += len(vec.returns)
+        total += sum(vec.returns)
+        vec.returns.clear()
+    elapsed = time.perf_counter() - start
+    vec.close()
+    steps = rounds * args.envs
+    mean = total / episodes if episodes else 0.0
+    print(f"{args.env}: {steps} steps in {elapsed:.2f} s ({steps / elapsed * 60:,.0f} steps/min), "
+          f"{episodes} episodes, mean score {mean:.2f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,726 +1,2599 @@
-import pygame, sys, random, math
-
-# Global setup
-pygame.init()
-WIDTH, HEIGHT = 800, 600
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Game Hub")
-clock = pygame.time.Clock()
-font = pygame.font.SysFont(None, 36)
-
-def transition_effect(text="Loading", duration=1200):
-    fade = pygame.Surface((WIDTH, HEIGHT))
-    fade.fill((0, 0, 0))
-    start = pygame.time.get_ticks()
-    dot_count = 0
-
-    while True:
-        now = pygame.time.get_ticks()
-        elapsed = now - start
-        alpha = min(255, int(255 * (elapsed / duration)))
-        fade.set_alpha(alpha)
-
-        # Animate dots: "Loading.", "Loading..", "Loading..."
-        if elapsed % 500 < 100:
-            dot_count = (dot_count + 1) % 4
-        dots = "." * dot_count
-
-        screen.fill((20, 20, 30))
-        loading_text = font.render(f"{text}{dots}", True, (255, 255, 255))
-        screen.blit(loading_text, (WIDTH // 2 - loading_text.get_width() // 2, HEIGHT // 2 - 20))
-        screen.blit(fade, (0, 0))
-
-        pygame.display.flip()
-        if elapsed >= duration:
-            break
-        clock.tick(60)
-# -------- Snake Game --------
-def run_snake():
-    BLOCK = 20
-    snake = [(WIDTH//2, HEIGHT//2)]
-    direction = (BLOCK, 0)
-    apple = (random.randint(0, WIDTH//BLOCK - 1)*BLOCK, random.randint(0, HEIGHT//BLOCK - 1)*BLOCK)
-    score = 0
-    running = True
-
-    while running:
-        screen.fill((0, 0, 0))
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT: return
-            elif e.type == pygame.KEYDOWN:
-                if e.key == pygame.K_UP: direction = (0, -BLOCK)
-                elif e.key == pygame.K_DOWN: direction = (0, BLOCK)
-                elif e.key == pygame.K_LEFT: direction = (-BLOCK, 0)
-                elif e.key == pygame.K_RIGHT: direction = (BLOCK, 0)
-
-        head = (snake[0][0] + direction[0], snake[0][1] + direction[1])
-        if head in snake or not (0 <= head[0] < WIDTH and 0 <= head[1] < HEIGHT): return
-        snake.insert(0, head)
-        if head == apple:
-            score += 1
-            apple = (random.randint(0, WIDTH//BLOCK - 1)*BLOCK, random.randint(0, HEIGHT//BLOCK - 1)*BLOCK)
-        else:
-            snake.pop()
-
-        pygame.draw.rect(screen, (255,0,0), (*apple, BLOCK, BLOCK))
-        for s in snake: pygame.draw.rect(screen, (0,255,0), (*s, BLOCK, BLOCK))
-        score_text = font.render(f"Score: {score}", True, (255,255,255))
-        screen.blit(score_text, (10,10))
-        pygame.display.flip()
-        clock.tick(10)
-
-# -------- Dodge Game --------
-def run_dodge():
-    player = pygame.Rect(WIDTH//2, HEIGHT-50, 40, 40)
-    blocks = [pygame.Rect(random.randint(0, WIDTH-30), -60*i, 30, 30) for i in range(10)]
-    speed = 5
-    score = 0
-    running = True
-
-    while running:
-        screen.fill((0, 0, 0))
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT: return
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT] and player.left > 0: player.move_ip(-5, 0)
-        if keys[pygame.K_RIGHT] and player.right < WIDTH: player.move_ip(5, 0)
-
-        for b in blocks:
-            b.move_ip(0, speed)
-            if b.colliderect(player): return
-            if b.top > HEIGHT:
-                b.y = -30
-                b.x = random.randint(0, WIDTH - b.width)
-                score += 1
-
-        pygame.draw.rect(screen, (0,255,0), player)
-        for b in blocks: pygame.draw.rect(screen, (255,0,0), b)
-        score_text = font.render(f"Score: {score}", True, (255,255,255))
-        screen.blit(score_text, (10,10))
-        pygame.display.flip()
-        clock.tick(60)
-
-# -------- Main Menu --------
-def main_menu():
-    WIDTH, HEIGHT = 800, 600
-    running = True
-    games = [("Snake", run_snake), ("Dodge", run_dodge), ("Flapy", run_flappy), ("Break out", run_breakout), ("Pong", run_pong), ("Memory", run_memory), ("Clicker", run_clicker), ("Asteroids", run_asteroids), ("Quess the number", run_guess_the_number), ("Geometry dash", run_geometry_dash)]  # Add more as we go
-    selected_index = 0
-    visible_limit = 6
-    scroll_offset = 0
-
-    # Background animation
-    background_shapes = [[random.randint(0, WIDTH), random.randint(0, HEIGHT)] for _ in range(40)]
-
-    while True:
-        # Glowing background color
-        ticks = pygame.time.get_ticks()
-        r = 20 + int(20 * math.sin(ticks * 0.002))
-        g = 20 + int(20 * math.sin(ticks * 0.004))
-        b = 30 + int(20 * math.sin(ticks * 0.003))
-        screen.fill((r, g, b))
-
-        # Floating cube animation
-        for shape in background_shapes:
-            shape[0] -= 1
-            if shape[0] < -20:
-                shape[0] = WIDTH + random.randint(0, 100)
-                shape[1] = random.randint(0, HEIGHT - 20)
-            pygame.draw.rect(screen, (50, 255, 255), pygame.Rect(shape[0], shape[1], 20, 20))
-
-        # Handle input
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_UP:
-                    if selected_index > 0:
-                        selected_index -= 1
-                        if selected_index < scroll_offset:
-                            scroll_offset -= 1
-                elif event.key == pygame.K_DOWN:
-                    if selected_index < len(games) - 1:
-                        selected_index += 1
-                        if selected_index >= scroll_offset + visible_limit:
-                            scroll_offset += 1
-                elif event.key == pygame.K_RETURN:
-                    name, func = games[selected_index]
-                    transition_effect(f"Loading {name}")
-                    func()
-
-        # Draw menu items
-        for i in range(visible_limit):
-            idx = scroll_offset + i
-            if idx >= len(games):
-                break
-            name, _ = games[idx]
-            y = 120 + i * 60
-            rect = pygame.Rect(200, y, 400, 50)
-            is_selected = idx == selected_index
-            color = (0, 200, 255) if is_selected else (80, 80, 120)
-            pygame.draw.rect(screen, color, rect)
-            label = font.render(name, True, (255, 255, 255))
-            screen.blit(label, (rect.x + 20, rect.y + 10))
-
-        # Scrollbar indicator
-        info = font.render(f"{selected_index + 1}/{len(games)}", True, (180, 180, 200))
-        screen.blit(info, (WIDTH - 120, HEIGHT - 40))
-
-        pygame.display.flip()
-        clock.tick(60)
-
-def run_flappy():
-    bird = pygame.Rect(100, HEIGHT//2, 30, 30)
-    gravity = 0
-    pipes = []
-    pipe_timer = 0
-    score = 0
-    running = True
-
-    while running:
-        screen.fill((135, 206, 235))
-        gravity += 1
-        bird.y += gravity // 3
-
-        pipe_timer += 1
-        if pipe_timer > 60:
-            h = random.randint(100, 400)
-            pipes.append(pygame.Rect(WIDTH, 0, 50, h))
-            pipes.append(pygame.Rect(WIDTH, h + 150, 50, HEIGHT - h - 150))
-            pipe_timer = 0
-
-        for p in pipes:
-            p.x -= 5
-            if p.colliderect(bird): return
-
-        pipes = [p for p in pipes if p.x > -50]
-        score += 0.01
-
-        pygame.draw.rect(screen, (255, 255, 0), bird)
-        for p in pipes: pygame.draw.rect(screen, (0, 255, 0), p)
-
-        score_text = font.render(f"Score: {int(score)}", True, (255,255,255))
-        screen.blit(score_text, (10,10))
-        pygame.display.flip()
-
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT: return
-            elif e.type == pygame.KEYDOWN:
-                if e.key == pygame.K_SPACE: gravity = -25
-
-        clock.tick(60)
-def run_breakout():
-    ball = pygame.Rect(WIDTH//2, HEIGHT//2, 15, 15)
-    paddle = pygame.Rect(WIDTH//2 - 60, HEIGHT - 30, 120, 10)
-    blocks = [pygame.Rect(x * 60 + 20, y * 20 + 40, 50, 15) for x in range(13) for y in range(5)]
-    dx, dy = 4, -4
-    running = True
-    score = 0
-
-    while running:
-        screen.fill((0, 0, 0))
-        ball.x += dx
-        ball.y += dy
-
-        if ball.left <= 0 or ball.right >= WIDTH: dx *= -1
-        if ball.top <= 0: dy *= -1
-        if ball.bottom >= HEIGHT: return
-
-        if ball.colliderect(paddle): dy *= -1
-        for block in blocks[:]:
-            if ball.colliderect(block):
-                blocks.remove(block)
-                dy *= -1
-                score += 1
-                break
-
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT] and paddle.left > 0: paddle.move_ip(-6, 0)
-        if keys[pygame.K_RIGHT] and paddle.right < WIDTH: paddle.move_ip(6, 0)
-
-        pygame.draw.rect(screen, (255, 255, 255), ball)
-        pygame.draw.rect(screen, (200, 200, 200), paddle)
-        for block in blocks:
-            pygame.draw.rect(screen, (255, 0, 0), block)
-
-        score_text = font.render(f"Score: {score}", True, (255,255,255))
-        screen.blit(score_text, (10,10))
-        pygame.display.flip()
-
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT: return
-
-        clock.tick(60)
-def run_pong():
-    WIDTH, HEIGHT = 800, 600
-    WHITE, BLACK = (255, 255, 255), (0, 0, 0)
-    PADDLE_WIDTH, PADDLE_HEIGHT = 10, 100
-    BALL_RADIUS = 10
-    PADDLE_SPEED = 6
-    WINNING_SCORE = 10
-
-    screen = pygame.display.set_mode((WIDTH, HEIGHT))
-    font = pygame.font.Font(None, 36)
-    win_font = pygame.font.Font(None, 72)
-    menu_font = pygame.font.Font(None, 48)
-    clock = pygame.time.Clock()
-
-    def reset_ball(ball, ball_speed):
-        ball.center = (WIDTH // 2, HEIGHT // 2)
-        ball_speed[0] = 5 * random.choice((1, -1))
-        ball_speed[1] = 5 * random.choice((1, -1))
-
-    def display_winner(text):
-        win_text = win_font.render(text, True, WHITE)
-        screen.blit(win_text, (WIDTH // 2 - win_text.get_width() // 2, HEIGHT // 2 - win_text.get_height() // 2))
-        pygame.display.flip()
-        pygame.time.wait(3000)
-
-    def difficulty_menu():
-        while True:
-            screen.fill(BLACK)
-            options = [
-                ("1. Easy", 3),
-                ("2. Medium", 5),
-                ("3. Hard", 7),
-                ("4. Impossible", 10)
-            ]
-            title = win_font.render("Select AI Difficulty", True, WHITE)
-            screen.blit(title, (WIDTH // 2 - title.get_width() // 2, HEIGHT // 4))
-            for i, (label, _) in enumerate(options):
-                txt = menu_font.render(label, True, WHITE)
-                screen.blit(txt, (WIDTH // 2 - txt.get_width() // 2, HEIGHT // 2 + i * 50 - 40))
-            pygame.display.flip()
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT: return None
-                if event.type == pygame.KEYDOWN:
-                    if event.key in [pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4]:
-                        return options[event.key - pygame.K_1][1]
-
-    def mode_menu():
-        while True:
-            screen.fill(BLACK)
-            title = win_font.render("PONG", True, WHITE)
-            screen.blit(title, (WIDTH // 2 - title.get_width() // 2, HEIGHT // 3))
-            single = menu_font.render("1. Single Player", True, WHITE)
-            two = menu_font.render("2. Two Player", True, WHITE)
-            screen.blit(single, (WIDTH // 2 - single.get_width() // 2, HEIGHT // 2))
-            screen.blit(two, (WIDTH // 2 - two.get_width() // 2, HEIGHT // 2 + 60))
-            pygame.display.flip()
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT: return None, None
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_1:
-                        ai_speed = difficulty_menu()
-                        return True, ai_speed
-                    elif event.key == pygame.K_2:
-                        return False, 0
-
-    def game_loop(single_player, ai_speed):
-        player1 = pygame.Rect(10, HEIGHT//2 - PADDLE_HEIGHT//2, PADDLE_WIDTH, PADDLE_HEIGHT)
-        player2 = pygame.Rect(WIDTH - 20, HEIGHT//2 - PADDLE_HEIGHT//2, PADDLE_WIDTH, PADDLE_HEIGHT)
-        ball = pygame.Rect(WIDTH//2 - BALL_RADIUS, HEIGHT//2 - BALL_RADIUS, BALL_RADIUS*2, BALL_RADIUS*2)
-        ball_speed = [5 * random.choice((1, -1)), 5 * random.choice((1, -1))]
-        score1, score2 = 0, 0
-
-        while True:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT: return
-
-            keys = pygame.key.get_pressed()
-            if keys[pygame.K_w] and player1.top > 0: player1.y -= PADDLE_SPEED
-            if keys[pygame.K_s] and player1.bottom < HEIGHT: player1.y += PADDLE_SPEED
-
-            if single_player:
-                if ball.centery > player2.centery and player2.bottom < HEIGHT:
-                    player2.y += ai_speed
-                elif ball.centery < player2.centery and player2.top > 0:
-                    player2.y -= ai_speed
-            else:
-                if keys[pygame.K_UP] and player2.top > 0: player2.y -= PADDLE_SPEED
-                if keys[pygame.K_DOWN] and player2.bottom < HEIGHT: player2.y += PADDLE_SPEED
-
-            ball.x += ball_speed[0]
-            ball.y += ball_speed[1]
-
-            if ball.top <= 0 or ball.bottom >= HEIGHT:
-                ball_speed[1] *= -1
-
-            if ball.colliderect(player1) or ball.colliderect(player2):
-                ball_speed[0] *= -1.1
-                ball_speed[1] *= 1.1
-
-            if ball.left <= 0:
-                score2 += 1
-                reset_ball(ball, ball_speed)
-            elif ball.right >= WIDTH:
-                score1 += 1
-                reset_ball(ball, ball_speed)
-
-            if score1 >= WINNING_SCORE:
-                display_winner("Player 1 Wins!")
-                return
-            elif score2 >= WINNING_SCORE:
-                winner = "Computer Wins!" if single_player else "Player 2 Wins!"
-                display_winner(winner)
-                return
-
-            screen.fill(BLACK)
-            pygame.draw.rect(screen, WHITE, player1)
-            pygame.draw.rect(screen, WHITE, player2)
-            pygame.draw.ellipse(screen, WHITE, ball)
-            pygame.draw.aaline(screen, WHITE, (WIDTH//2, 0), (WIDTH//2, HEIGHT))
-
-            score_text1 = font.render(str(score1), True, WHITE)
-            score_text2 = font.render(str(score2), True, WHITE)
-            screen.blit(score_text1, (WIDTH//2 - 50, 20))
-            screen.blit(score_text2, (WIDTH//2 + 30, 20))
-
-            pygame.display.flip()
-            clock.tick(60)
-
-    single, ai_speed = mode_menu()
-    if single is not None:
-        game_loop(single, ai_speed)
-def run_memory():
-    WIDTH, HEIGHT = 800, 600
-    screen = pygame.display.set_mode((WIDTH, HEIGHT))
-    clock = pygame.time.Clock()
-    font = pygame.font.SysFont(None, 36)
-
-    ROWS, COLS = 4, 4
-    CARD_SIZE = 100
-    GAP = 20
-
-    # Grid layout
-    grid_width = COLS * CARD_SIZE + (COLS - 1) * GAP
-    grid_height = ROWS * CARD_SIZE + (ROWS - 1) * GAP
-    start_x = (WIDTH - grid_width) // 2
-    start_y = (HEIGHT - grid_height) // 2
-
-    # Create card positions
-    card_positions = []
-    for row in range(ROWS):
-        for col in range(COLS):
-            x = start_x + col * (CARD_SIZE + GAP)
-            y = start_y + row * (CARD_SIZE + GAP)
-            card_positions.append(pygame.Rect(x, y, CARD_SIZE, CARD_SIZE))
-
-    # Create card values (2 of each)
-    values = list(range(1, (ROWS * COLS) // 2 + 1)) * 2
-    random.shuffle(values)
-    revealed = [False] * len(values)
-    matched = [False] * len(values)
-    selection = []
-
-    # Main loop
-    while True:
-        screen.fill((20, 20, 30))
-        mx, my = pygame.mouse.get_pos()
-        click = False
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT: return
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                click = True
-
-        for i, rect in enumerate(card_positions):
-            if rect.collidepoint((mx, my)) and click and not revealed[i] and not matched[i]:
-                revealed[i] = True
-                selection.append(i)
-                if len(selection) == 2:
-                    pygame.time.wait(600)
-                    a, b = selection
-                    if values[a] == values[b]:
-                        matched[a] = matched[b] = True
-                    else:
-                        revealed[a] = revealed[b] = False
-                    selection = []
-
-        for i, rect in enumerate(card_positions):
-            color = (100, 100, 255) if not revealed[i] else (0, 200, 0)
-            pygame.draw.rect(screen, color, rect)
-            pygame.draw.rect(screen, (255,255,255), rect, 2)
-            if revealed[i] or matched[i]:
-                txt = font.render(str(values[i]), True, (255, 255, 255))
-                screen.blit(txt, (rect.x + CARD_SIZE//2 - txt.get_width()//2,
-                                  rect.y + CARD_SIZE//2 - txt.get_height()//2))
-
-        pygame.display.flip()
-        clock.tick(60)
-def run_clicker():
-    WIDTH, HEIGHT = 800, 600
-    screen = pygame.display.set_mode((WIDTH, HEIGHT))
-    clock = pygame.time.Clock()
-    font = pygame.font.SysFont(None, 36)
-
-    # Game state
-    money = 0
-    click_value = 1
-    click_upgrade_cost = 50
-    auto_clickers = 0
-    auto_clicker_cost = 100
-    last_auto_click = 0
-
-    while True:
-        screen.fill((20, 20, 30))
-        mx, my = pygame.mouse.get_pos()
-        for event in pygame.event.get():
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                mx, my = event.pos  # Mouse click position
-                if click_zone.collidepoint((mx, my)):
-                    money += click_value
-                elif click_upgrade_btn.collidepoint((mx, my)) and money >= click_upgrade_cost:
-                    money -= click_upgrade_cost
-                    click_value += 1
-                    click_upgrade_cost = int(click_upgrade_cost * 1.5)
-                elif auto_clicker_btn.collidepoint((mx, my)) and money >= auto_clicker_cost:
-                    money -= auto_clicker_cost
-                    auto_clickers += 1
-                    auto_clicker_cost = int(auto_clicker_cost * 1.5)
-
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT: return
-
-        # Click money zone
-        click_zone = pygame.Rect(WIDTH//2 - 100, HEIGHT//2 - 50, 200, 100)
-
-
-        # Upgrade: click value
-        click_upgrade_btn = pygame.Rect(50, 100, 240, 60)
-        
-
-        # Upgrade: auto-clicker
-        auto_clicker_btn = pygame.Rect(50, 180, 240, 60)
-        
-
-        # Auto-click income
-        now = pygame.time.get_ticks()
-        if now - last_auto_click >= 1000:
-            money += auto_clickers
-            last_auto_click = now
-
-        # UI Drawing
-        pygame.draw.rect(screen, (0, 200, 255), click_zone)
-        screen.blit(font.render("CLICK", True, (255, 255, 255)), (click_zone.x + 50, click_zone.y + 35))
-
-        pygame.draw.rect(screen, (50, 50, 100), click_upgrade_btn)
-        screen.blit(font.render(f"Upgrade Click (${click_upgrade_cost})", True, (255,255,255)), (click_upgrade_btn.x + 10, click_upgrade_btn.y + 10))
-
-        pygame.draw.rect(screen, (50, 100, 50), auto_clicker_btn)
-        screen.blit(font.render(f"Auto-Clicker (${auto_clicker_cost})", True, (255,255,255)), (auto_clicker_btn.x + 10, auto_clicker_btn.y + 10))
-
-        screen.blit(font.render(f"Money: ${money}", True, (255,255,255)), (50, 40))
-        screen.blit(font.render(f"Click Power: +{click_value}", True, (255,255,255)), (50, 320))
-        screen.blit(font.render(f"Auto-Clickers: {auto_clickers}", True, (255,255,255)), (50, 360))
-
-        pygame.display.flip()
-        clock.tick(60)
-
-def run_asteroids():
-    player = pygame.Rect(WIDTH//2, HEIGHT - 50, 30, 30)
-    asteroids = [pygame.Rect(random.randint(0, WIDTH-30), -60*i, 30, 30) for i in range(10)]
-    score = 0
-    while True:
-        screen.fill((10, 10, 20))
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT] and player.left > 0: player.x -= 5
-        if keys[pygame.K_RIGHT] and player.right < WIDTH: player.x += 5
-        for a in asteroids:
-            a.y += 4
-            if a.colliderect(player): return
-            if a.top > HEIGHT:
-                a.y = -30
-                a.x = random.randint(0, WIDTH - 30)
-                score += 1
-        pygame.draw.rect(screen, (0, 200, 200), player)
-        for a in asteroids: pygame.draw.rect(screen, (200, 200, 0), a)
-        screen.blit(font.render(f"Score: {score}", True, (255,255,255)), (10,10))
-        pygame.display.flip()
-        for e in pygame.event.get(): 
-            if e.type == pygame.QUIT: return
-        clock.tick(60)
-def run_guess_the_number():
-    WIDTH, HEIGHT = 800, 600
-    screen = pygame.display.set_mode((WIDTH, HEIGHT))
-    pygame.display.set_caption("Guess the Number")
-    font = pygame.font.Font(None, 48)
-    input_font = pygame.font.Font(None, 36)
-
-    target = random.randint(1, 100)
-    guess = ""
-    result = "Enter a number between 1 and 100"
-    color = (255, 255, 255)
-    active = True
-    play_again = False
-
-    button = pygame.Rect(WIDTH//2 - 80, HEIGHT//2 + 60, 160, 40)
-
-    while True:
-        screen.fill((20, 20, 30))
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return
-            elif event.type == pygame.KEYDOWN and active:
-                if event.key == pygame.K_RETURN:
-                    if guess.isdigit():
-                        num = int(guess)
-                        if num < target:
-                            result = "Too low!"
-                        elif num > target:
-                            result = "Too high!"
-                        else:
-                            result = "Correct! 🎉"
-                            color = (0, 255, 0)
-                            active = False
-                            play_again = True
-                    else:
-                        result = "Enter digits only!"
-                    guess = ""
-                elif event.key == pygame.K_BACKSPACE:
-                    guess = guess[:-1]
-                else:
-                    if len(guess) < 3:
-                        guess += event.unicode
-            elif event.type == pygame.MOUSEBUTTONDOWN and play_again:
-                if button.collidepoint(event.pos):
-                    target = random.randint(1, 100)
-                    result = "Enter a number between 1 and 100"
-                    color = (255, 255, 255)
-                    active = True
-                    play_again = False
-                    guess = ""
-
-        txt_box = pygame.Rect(WIDTH//2 - 80, HEIGHT//2 - 30, 160, 40)
-        pygame.draw.rect(screen, color, txt_box, 2)
-        txt_surface = input_font.render(guess, True, color)
-        screen.blit(txt_surface, (txt_box.x + 10, txt_box.y + 5))
-
-        result_msg = font.render(result, True, color)
-        screen.blit(result_msg, (WIDTH//2 - result_msg.get_width()//2, HEIGHT//2 - 100))
-
-        if play_again:
-            pygame.draw.rect(screen, (0, 150, 150), button)
-            btn_text = input_font.render("Play Again", True, (255, 255, 255))
-            screen.blit(btn_text, (button.x + 20, button.y + 5))
-
-        pygame.display.flip()
-        clock.tick(30)
-def run_geometry_dash():
-    WIDTH, HEIGHT = 800, 600
-    screen = pygame.display.set_mode((WIDTH, HEIGHT))
-    clock = pygame.time.Clock()
-    font = pygame.font.SysFont(None, 36)
-
-    player = pygame.Rect(100, HEIGHT - 80, 40, 40)
-    velocity_y = 0
-    gravity = 0.8
-    jump_force = -12
-
-    scroll_x = 0
-    score = 0
-    level_length = 5000
-
-    ground_height = 40
-    ground_y = HEIGHT - ground_height
-
-    blocks = []
-    floor_spikes = []
-    platform_spikes = []
-    spawn_timer = 0
-    win = False
-
-    def spawn_block(x):
-        y = random.choice([ground_y - 60, ground_y - 80])  # Reachable only
-        return pygame.Rect(x, y, 80, 20)
-
-    def spawn_floor_spike(x):
-        return pygame.Rect(x, ground_y - 30, 30, 30)
-
-    def spawn_platform_spike(block):
-        # Spawns directly on the ground, same x as block
-        return pygame.Rect(block.x + 25, ground_y - 30, 30, 30)
-
-    while True:
-        screen.fill((30, 30, 30))
-
-        if win:
-            msg = font.render("Level Complete!", True, (0, 255, 0))
-            screen.blit(msg, (WIDTH // 2 - msg.get_width() // 2, HEIGHT // 2))
-            pygame.display.flip()
-            pygame.time.wait(3000)
-            return
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE and velocity_y == 0:
-                    velocity_y = jump_force
-
-        spawn_timer += 1
-        if spawn_timer > 60:
-            x = WIDTH + scroll_x
-            r = random.random()
-            if r < 0.6:
-                block = spawn_block(x)
-                blocks.append(block)
-                # Add a spike below the platform at ground level
-                platform_spikes.append(spawn_platform_spike(block))
-            elif r < 0.85:
-                floor_spikes.append(spawn_floor_spike(x))
-            spawn_timer = 0
-
-        velocity_y += gravity
-        player.y += velocity_y
-
-        safe_landing = False
-        for block in blocks:
-            bx = block.x - scroll_x
-            block_screen = pygame.Rect(bx, block.y, block.width, block.height)
-            if player.colliderect(block_screen):
-                if velocity_y > 0 and player.bottom <= block.y + 10:
-                    player.bottom = block.y
-                    velocity_y = 0
-                    safe_landing = True
-                else:
-                    return
-
-        if player.bottom >= ground_y and not safe_landing:
-            player.bottom = ground_y
-            velocity_y = 0
-
-        for spike in floor_spikes + platform_spikes:
-            sx = spike.x - scroll_x
-            hitbox = pygame.Rect(sx, spike.y, spike.width, spike.height)
-            if hitbox.colliderect(player):
-                return
-
-        scroll_x += 6
-        score += 1
-        if scroll_x > level_length:
-            win = True
-
-        pygame.draw.rect(screen, (0, 255, 255), player)
-        pygame.draw.rect(screen, (100, 100, 100), (0, ground_y, WIDTH, ground_height))
-        screen.blit(font.render(f"Distance: {score}", True, (255, 255, 255)), (10, 10))
-
-        for block in blocks:
-            bx = block.x - scroll_x
-            if -80 < bx < WIDTH:
-                pygame.draw.rect(screen, (150, 150, 150), (bx, block.y, block.width, block.height))
-
-        for spike in floor_spikes + platform_spikes:
-            sx = spike.x - scroll_x
-            if -30 < sx < WIDTH:
-                pygame.draw.polygon(screen, (255, 50, 50), [
-                    (sx, spike.bottom),
-                    (sx + spike.width // 2, spike.top),
-                    (sx + spike.width, spike.bottom)
-                ])
-
-        pygame.display.flip()
-        clock.tick(60)
-if __name__ == "__main__":
-    main_menu()
+import os, sys, gc, time, json, mmap, struct, random, math, queue, asyncio, threading
+START_TIME = time.perf_counter()
+from array import array
+from fractions import Fraction
+from collections import OrderedDict, deque, namedtuple
+
+def arg_value(flag):
+    # Value following `flag` on the command line, or None
+    if flag in sys.argv[:-1]:
+        return sys.argv[sys.argv.index(flag) + 1]
+    return None
+
+# Headless mode: dummy video driver, no flip, no frame cap
+HEADLESS = "--headless" in sys.argv or os.environ.get("GAME_HUB_HEADLESS") == "1"
+# Browser builds (pygbag and the like) have no threads and need the asyncio loop
+BROWSER = sys.platform == "emscripten"
+THREADS = not BROWSER
+if HEADLESS:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+# -------- Resources --------
+# Only the subsystems the hub uses are initialized; every game shares one
+# display surface, one clock and the cached fonts below
+pygame.display.init()
+pygame.font.init()
+WIDTH, HEIGHT = 800, 600
+
+# Render scale: games always draw WIDTH x HEIGHT onto `screen`, which is
+# RENDER_SCALE of the output size and upscaled once per frame in show().
+# SCALER "sdl" lets SDL scale on the GPU (pygame.SCALED); "scale" and
+# "smooth" scale in software. Either way the window is sized here.
+#   python game_hub.py [--render-scale 0.5] [--scaler sdl|scale|smooth] [--fullscreen]
+def parse_render_scale(value):
+    try:
+        scale = float(value)
+    except ValueError:
+        scale = 0.0
+    if not 0 < scale < math.inf:
+        raise ValueError(f"render scale must be a positive number, got {value!r}")
+    return scale
+
+RENDER_SCALE = parse_render_scale(arg_value("--render-scale") or os.environ.get("GAME_HUB_RENDER_SCALE", "1"))
+SCALER = arg_value("--scaler") or os.environ.get("GAME_HUB_SCALER", "smooth")
+FULLSCREEN = "--fullscreen" in sys.argv
+SCALERS = {"scale": pygame.transform.scale, "smooth": pygame.transform.smoothscale}
+
+def open_display():
+    # Returns (window, screen): the display surface and the one games draw on
+    fullscreen = pygame.FULLSCREEN if FULLSCREEN and not HEADLESS else 0
+    if HEADLESS or (RENDER_SCALE == 1 and not fullscreen):
+        window = pygame.display.set_mode((WIDTH, HEIGHT))
+        return window, window
+    size = (round(WIDTH / RENDER_SCALE), round(HEIGHT / RENDER_SCALE))
+    if SCALER == "sdl":
+        window = pygame.display.set_mode((WIDTH, HEIGHT), pygame.SCALED | fullscreen)
+        if not fullscreen:
+            # SDL opens SCALED windows at a whole multiple of the game size
+            try:
+                from pygame._sdl2.video import Window
+                Window.from_display_module().size = size
+            except ImportError:
+                print("--scaler sdl: this pygame cannot resize the window, --render-scale ignored", file=sys.stderr)
+        return window, window
+    if SCALER not in SCALERS:
+        raise ValueError(f"unknown scaler {SCALER!r}, expected sdl, scale or smooth")
+    if fullscreen: size = (0, 0)
+    window = pygame.display.set_mode(size, fullscreen)
+    return window, pygame.Surface((WIDTH, HEIGHT)).convert()
+
+window, screen = open_display()
+pygame.display.set_caption("Game Hub")
+
+def show(rects=None):
+    # Put the finished frame on the display: all of it, or just `rects`
+    if window is not screen:
+        SCALERS[SCALER](screen, window.get_size(), window)
+        pygame.display.flip()
+    elif rects is None:
+        pygame.display.flip()
+    else:
+        pygame.display.update(rects)
+
+def to_screen(pos):
+    # Window coordinates to game coordinates
+    if window is screen: return pos
+    w, h = window.get_size()
+    return (pos[0] * WIDTH // w, pos[1] * HEIGHT // h)
+clock = pygame.time.Clock()
+
+def get_ticks():
+    # get_ticks() needs the SDL timer, which pygame.init() would start
+    return int((time.perf_counter() - START_TIME) * 1000)
+
+fonts = {}
+
+def get_font(size):
+    # pygame's bundled default font, loaded on first use: no system font scan
+    if size not in fonts:
+        fonts[size] = pygame.font.Font(None, size)
+    return fonts[size]
+
+font = get_font(36)
+
+# Startup and game-switch latency, printed with --timings
+TIMINGS = "--timings" in sys.argv
+timings = {"startup_ms": 0.0, "switch_ms": []}
+
+def record_timing(name, start):
+    ms = (time.perf_counter() - start) * 1000
+    if name == "switch_ms":
+        timings[name].append(ms)
+    else:
+        timings[name] = ms
+    if TIMINGS:
+        print(f"{name}: {ms:.1f}")
+
+# -------- Input --------
+# All input goes through here: the queue only accepts the event types the
+# running game handles, it is drained once per frame by poll_input(), and
+# games get that frame as an immutable InputFrame.
+EXPOSE_EVENTS = (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE, pygame.VIDEORESIZE)
+BASE_EVENTS = (pygame.QUIT, pygame.KEYDOWN) + EXPOSE_EVENTS
+
+def allow_events(extra=()):
+    # Everything else (mouse motion, key-ups, ...) is dropped by SDL before
+    # it reaches the queue
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(BASE_EVENTS + tuple(extra))
+
+allow_events()
+
+class HeldKeys(frozenset):
+    # Indexable like pygame.key.get_pressed(), for scripted input
+    def __getitem__(self, key):
+        return key in self
+
+class InputFrame(namedtuple("InputFrame", "events keys mouse")):
+    # One tick of input: events, held keys (pygame.key.get_pressed() or
+    # HeldKeys) and the mouse position
+    __slots__ = ()
+
+    def __new__(cls, events=(), keys=HeldKeys(), mouse=(0, 0)):
+        return super().__new__(cls, tuple(events), keys, tuple(mouse))
+
+    @property
+    def quit(self):
+        return any(e.type == pygame.QUIT for e in self.events)
+
+IDLE = InputFrame()
+
+def poll_input():
+    events = pygame.event.get()
+    if window is not screen:
+        # Software-scaled output: map mouse positions back to game pixels
+        events = [pygame.event.Event(e.type, e.dict, pos=to_screen(e.pos)) if hasattr(e, "pos") else e
+                  for e in events]
+    return InputFrame(events, pygame.key.get_pressed(), to_screen(pygame.mouse.get_pos()))
+
+def key_press(key, unicode="", held=()):
+    return InputFrame([pygame.event.Event(pygame.KEYDOWN, key=key, unicode=unicode)], HeldKeys(held))
+
+def key_hold(*keys):
+    return InputFrame(keys=HeldKeys(keys))
+
+def mouse_click(pos):
+    return InputFrame([pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1)], mouse=pos)
+
+# -------- Profiler --------
+PROFILER_KEY = pygame.K_F3
+
+class FrameProfiler:
+    # Per-phase frame timings for run_game. Inactive by default: the loop
+    # only checks `active`. F3 toggles the overlay (and with it, timing);
+    # --trace FILE times every frame and appends them to a Chrome trace JSON
+    # array (chrome://tracing, Perfetto) when a game exits, and every
+    # FLUSH_FRAMES frames in between, so memory stays flat.
+    PHASES = ("events", "update", "draw", "present", "tick")
+    COLORS = {"events": (80, 160, 255), "update": (80, 220, 120), "draw": (250, 200, 60),
+              "present": (230, 90, 200), "tick": (90, 90, 90)}
+    HISTORY = 120
+    FLUSH_FRAMES = 600
+    MS_PX = 4  # Graph scale: pixels per millisecond
+    rect = pygame.Rect(WIDTH - 250, 10, 240, 150)
+
+    def __init__(self, trace_path=None):
+        self.trace_path = trace_path
+        self.active = trace_path is not None
+        self.overlay = False
+        self.history = deque(maxlen=self.HISTORY)
+        self.events = []
+        self.trace_started = False
+        self.frame = {}
+        self.frame_start = self.last = 0
+        self.summary = []
+        self.summary_at = 0
+        self.frames = 0
+
+    def toggle_overlay(self):
+        self.overlay = not self.overlay
+        was_active, self.active = self.active, self.overlay or self.trace_path is not None
+        # Switched on mid-frame: time the rest of it from here, not from a
+        # stale start
+        if self.active and not was_active: self.begin()
+
+    def begin(self):
+        self.frame = {}
+        self.frame_start = self.last = time.perf_counter_ns()
+
+    def mark(self, phase):
+        now = time.perf_counter_ns()
+        self.frame[phase] = now - self.last
+        self.last = now
+
+    def end(self):
+        self.mark("tick")
+        self.history.append(self.frame)
+        self.frames += 1
+        if self.trace_path is not None:
+            ts = self.frame_start / 1000
+            for phase in self.PHASES:
+                dur = self.frame.get(phase, 0) / 1000
+                self.events.append({"name": phase, "ph": "X", "ts": ts, "dur": dur, "pid": 1, "tid": 1})
+                ts += dur
+            if self.frames % self.FLUSH_FRAMES == 0:
+                self.write_trace()
+
+    def write_trace(self):
+        # Append the buffered events and drop them; the file is a complete
+        # JSON array after every write
+        if self.trace_path is None or not self.events: return
+        body = ",\n".join(json.dumps(e) for e in self.events)
+        if self.trace_started:
+            with open(self.trace_path, "r+b") as f:
+                f.seek(-2, os.SEEK_END)  # Over the closing "\n]"
+                f.write((",\n" + body + "\n]").encode())
+        else:
+            with open(self.trace_path, "w") as f:
+                f.write("[\n" + body + "\n]")
+            self.trace_started = True
+        self.events.clear()
+
+    def draw_overlay(self, surface):
+        x0, y0, w, h = self.rect
+        surface.fill((0, 0, 0), self.rect)
+        base = y0 + 90
+        # One stacked column per frame, newest on the right
+        x = x0 + w - 2 * len(self.history)
+        for frame in self.history:
+            y = base
+            for phase in self.PHASES:
+                px = frame.get(phase, 0) * self.MS_PX // 1_000_000
+                if px:
+                    y -= px
+                    surface.fill(self.COLORS[phase], (x, max(y, y0), 2, min(px, y + px - y0)))
+                if y <= y0: break
+            x += 2
+        budget = base - int(1000 / 60 * self.MS_PX)
+        pygame.draw.line(surface, (255, 60, 60), (x0, budget), (x0 + w, budget))
+        # Averages, re-rendered twice a second rather than every frame
+        if self.frames >= self.summary_at:
+            self.summary_at = self.frames + 30
+            small = get_font(18)
+            n = max(1, len(self.history))
+            self.summary = [small.render(f"{phase} {sum(f.get(phase, 0) for f in self.history) / n / 1e6:.2f}ms",
+                                         True, self.COLORS[phase]) for phase in self.PHASES]
+        for i, label in enumerate(self.summary):
+            surface.blit(label, (x0 + 4 + (i % 2) * 118, base + 6 + (i // 2) * 18))
+
+profiler = FrameProfiler(arg_value("--trace"))
+
+# -------- Recording --------
+# Binary session log: per session a header (magic, version, seed, game class
+# name, the game's replay_options() as JSON) then one record per frame,
+# ending with END. A frame is a flags byte
+# followed only by what changed: held-key mask, mouse position, events.
+# Idle frames cost one byte.
+RECORD_MAGIC = b"GHRC"
+RECORD_VERSION = 2
+RECORD_HEADER = struct.Struct("<BQBH")  # version, seed, name length, options length
+RECORDED_KEYS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN, pygame.K_w, pygame.K_s, pygame.K_SPACE)
+HELD, MOUSE, EVENTS, END = 1, 2, 4, 0xFF
+EV_KEY, EV_CLICK, EV_QUIT = 0, 1, 2
+
+class InputRecorder:
+    def __init__(self, path):
+        self.path = path
+        self.file = None
+
+    def start(self, game, seed):
+        name = type(game).__name__.encode()
+        options = json.dumps(game.replay_options(), separators=(",", ":")).encode()
+        self.file = open(self.path, "ab")
+        self.file.write(RECORD_MAGIC + RECORD_HEADER.pack(RECORD_VERSION, seed, len(name), len(options))
+                        + name + options)
+        self.held, self.mouse, self.frames = 0, (0, 0), 0
+
+    def record(self, inp):
+        held = 0
+        for bit, key in enumerate(RECORDED_KEYS):
+            if inp.keys[key]: held |= 1 << bit
+        mouse = (min(max(inp.mouse[0], 0), 0xFFFF), min(max(inp.mouse[1], 0), 0xFFFF))
+        events = []
+        for e in inp.events:
+            if e.type == pygame.KEYDOWN:
+                text = e.unicode.encode()[:255]
+                events.append(struct.pack("<BIB", EV_KEY, e.key, len(text)) + text)
+            elif e.type == pygame.MOUSEBUTTONDOWN:
+                events.append(struct.pack("<BHHB", EV_CLICK, *e.pos, e.button))
+            elif e.type == pygame.QUIT:
+                events.append(bytes([EV_QUIT]))
+        flags = (HELD if held != self.held else 0) | (MOUSE if mouse != self.mouse else 0) | (EVENTS if events else 0)
+        out = bytearray([flags])
+        if flags & HELD: out.append(held)
+        if flags & MOUSE: out += struct.pack("<HH", *mouse)
+        if flags & EVENTS:
+            out.append(len(events))
+            for ev in events: out += ev
+        self.file.write(out)
+        self.held, self.mouse = held, mouse
+        # Flush about once a second so a crash still leaves a usable log
+        self.frames += 1
+        if self.frames % 60 == 0: self.file.flush()
+
+    def stop(self):
+        if self.file:
+            self.file.write(bytes([END]))
+            self.file.close()
+            self.file = None
+
+def read_frame(data, pos, held, mouse):
+    # Decode the frame record at `pos`, given the held keys and mouse position
+    # so far: (InputFrame, position after it). EOFError if the log ends inside it
+    def take(n):
+        nonlocal pos
+        if pos + n > len(data): raise EOFError
+        pos += n
+        return pos - n
+
+    flags = data[take(1)]
+    if flags & HELD:
+        bits = data[take(1)]
+        held = HeldKeys(key for bit, key in enumerate(RECORDED_KEYS) if bits >> bit & 1)
+    if flags & MOUSE:
+        mouse = struct.unpack_from("<HH", data, take(4))
+    events = []
+    if flags & EVENTS:
+        for _ in range(data[take(1)]):
+            kind = data[take(1)]
+            if kind == EV_KEY:
+                key, text_len = struct.unpack_from("<IB", data, take(5))
+                at = take(text_len)
+                events.append(pygame.event.Event(pygame.KEYDOWN, key=key, unicode=data[at:pos].decode()))
+            elif kind == EV_CLICK:
+                x, y, button = struct.unpack_from("<HHB", data, take(5))
+                events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(x, y), button=button))
+            else:
+                events.append(pygame.event.Event(pygame.QUIT))
+    return InputFrame(events, held, mouse), pos
+
+def read_recording(path):
+    # Yields (game class name, seed, options, [InputFrame, ...]) per session;
+    # a log cut short by a crash yields the complete frames before the cut
+    with open(path, "rb") as f:
+        data = f.read()
+    pos = 0
+    while data.startswith(RECORD_MAGIC, pos):
+        pos += len(RECORD_MAGIC)
+        if pos + RECORD_HEADER.size > len(data): return
+        version, seed, name_len, options_len = RECORD_HEADER.unpack_from(data, pos)
+        if version != RECORD_VERSION:
+            raise ValueError(f"unsupported recording version {version}")
+        pos += RECORD_HEADER.size
+        if pos + name_len + options_len > len(data): return
+        name = data[pos:pos + name_len].decode()
+        pos += name_len
+        options = json.loads(data[pos:pos + options_len])
+        pos += options_len
+        frames, held, mouse = [], HeldKeys(), (0, 0)
+        while pos < len(data) and data[pos] != END:
+            try:
+                frame, pos = read_frame(data, pos, held, mouse)
+            except EOFError:
+                pos = len(data)
+                break
+            held, mouse = frame.keys, frame.mouse
+            frames.append(frame)
+        pos += 1
+        yield name, seed, options, frames
+
+def replay(path, realtime=False):
+    # Play back every session in a recording: through run_game at the game's
+    # frame rate, or uncapped with simulate(); returns (name, ticks, game)
+    classes = {game_cls.__name__: game_cls for _, _, game_cls in GAMES}
+    results = []
+    for name, seed, options, frames in read_recording(path):
+        if realtime:
+            results.append((name, len(frames), run_game(classes[name], seed, iter(frames), **options)))
+        else:
+            ticks, game = simulate(classes[name], len(frames), frames, seed, **options)
+            results.append((name, ticks, game))
+    return results
+
+record_path = arg_value("--record")
+recorder = InputRecorder(record_path) if record_path else None
+
+# -------- Game loop --------
+class DirtyRects:
+    # Display regions changed since the last present; past MAX_RECTS a full
+    # flip is cheaper than many small updates
+    MAX_RECTS = 64
+
+    def __init__(self):
+        self.rects = []
+        self.full = True
+
+    def mark(self, rect):
+        if self.full: return
+        self.rects.append(rect)
+        if len(self.rects) > self.MAX_RECTS:
+            self.mark_all()
+
+    def mark_all(self):
+        self.full = True
+        self.rects.clear()
+
+    def present(self):
+        if self.full:
+            show()
+        elif self.rects:
+            show(self.rects)
+        self.rects.clear()
+        self.full = False
+
+class Scheduler:
+    # Hashed timer wheel counted in game ticks, so delays behave the same live,
+    # headless and in replays. Scheduling is O(1); each tick only looks at
+    # one slot, and timers more than SLOTS ticks out wait for later laps.
+    SLOTS = 256
+
+    def __init__(self):
+        self.wheel = [[] for _ in range(self.SLOTS)]
+        self.now = 0
+
+    def after(self, ticks, action):
+        due = self.now + max(1, ticks)
+        self.wheel[due % self.SLOTS].append((due, action))
+
+    def advance(self):
+        self.now += 1
+        slot = self.wheel[self.now % self.SLOTS]
+        if not slot: return
+        ready = [action for due, action in slot if due <= self.now]
+        if ready:
+            slot[:] = [(due, action) for due, action in slot if due > self.now]
+            for action in ready:
+                action()
+
+class Game:
+    fps = 60
+    caption = None  # Window title while the game runs
+    # Event types the game needs queued besides BASE_EVENTS
+    input_events = ()
+    # Fraction of a tick since the last update, set by run_game before each
+    # frame; draw() may use lerp() to smooth motion between ticks
+    alpha = 1.0
+    # Games opt in to dirty-rect rendering by setting this to a DirtyRects
+    # and marking what changes in update(); draw() still paints the full frame
+    dirty = None
+    # Atlas sprites (shape, w, h, color[, outline]) drawn with the default
+    # options, rasterized by preload()
+    sprites = ()
+
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+        self.timers = Scheduler()
+        self.finished = False
+
+    def after(self, ms, action):
+        # Run `action` once `ms` of game time has passed, without blocking
+        self.timers.after(round(ms * self.fps / 1000), action)
+
+    def finish(self):
+        self.finished = True
+
+    def lerp(self, prev, cur):
+        return prev + (cur - prev) * self.alpha
+
+    def close(self):
+        # Called once when the live loop exits, however it exits
+        pass
+
+    def step(self, inp):
+        # One tick as driven by the loops: timers first, then update()
+        self.timers.advance()
+        if self.finished: return False
+        return self.update(inp)
+
+    def update(self, inp):
+        # Advance one tick; return False when the game is over
+        return True
+
+    def draw(self, surface):
+        pass
+
+    @classmethod
+    def preload(cls, **options):
+        # Warm fonts, pinned text, sprites and game data ahead of a live start
+        # with `options`; runs on a worker thread during the menu transition,
+        # so nothing here may touch the display
+        for sprite in cls.sprites:
+            atlas.prepare(*sprite)
+
+    @classmethod
+    def live_options(cls):
+        # Constructor options for interactive sessions only, not replays
+        return {}
+
+    def replay_options(self):
+        # Constructor options a replay needs to start from this game's
+        # current state; recorded in the session header
+        return {}
+
+def present(game):
+    dirty = game.dirty
+    if dirty is not None and not (dirty.full or dirty.rects or profiler.overlay):
+        return
+    game.draw(screen)
+    if profiler.active:
+        profiler.mark("draw")
+        if profiler.overlay:
+            profiler.draw_overlay(screen)
+            if dirty: dirty.mark(profiler.rect)
+    if dirty is None:
+        show()
+    else:
+        dirty.present()
+
+DISPLAY_FPS = 60  # Frame cap; games tick at their own fps underneath
+MAX_CATCHUP = 5  # Ticks a single frame may run before lag is dropped
+
+class FixedStep:
+    # Fixed-timestep accumulator: real time in, whole ticks out. After a
+    # stall at most max_steps ticks run in one frame and the rest of the
+    # backlog is dropped, so a slow machine slows the game down instead of
+    # spiralling. `alpha` is how far the frame is into the next tick.
+    def __init__(self, fps, max_steps=MAX_CATCHUP):
+        self.dt = 1000 / fps
+        self.max_steps = max_steps
+        self.acc = self.dt  # The first frame runs a tick straight away
+        self.last = None
+        self.alpha = 0.0
+
+    def advance(self, now_ms):
+        if self.last is not None:
+            self.acc += now_ms - self.last
+        self.last = now_ms
+        steps = int(self.acc // self.dt)
+        if steps > self.max_steps:
+            steps = self.max_steps
+            self.acc = steps * self.dt
+        self.acc -= steps * self.dt
+        self.alpha = self.acc / self.dt
+        return steps
+
+# Live loops are generators that yield once per frame with the frame rate
+# to hold; drive() runs one blocking on clock.tick(), drive_async() as an
+# asyncio coroutine that sleeps between frames so other tasks can run (and
+# browser runtimes get control back every frame). Nested loops, like a game
+# started from the menu, are delegated to with `yield from`.
+def drive(frames):
+    try:
+        while True:
+            fps = next(frames)
+            if fps: clock.tick(fps)
+    except StopIteration as stop:
+        return stop.value
+
+# Background work for runtimes without threads: under drive_async, spawn()
+# runs a coroutine function as an asyncio task, which gets the event loop
+# while the frame loop sleeps
+background_tasks = set()
+
+def spawn(func, *args):
+    # The task, or None when no event loop is running (drive())
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    task = loop.create_task(func(*args))
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    return task
+
+async def drive_async(frames):
+    deadline = time.perf_counter()
+    try:
+        while True:
+            fps = next(frames)
+            now = time.perf_counter()
+            deadline = max(now, deadline + 1 / fps) if fps else now
+            await asyncio.sleep(deadline - now)
+    except StopIteration as stop:
+        return stop.value
+
+def run_game(game_cls, seed=None, inputs=None, **options):
+    return drive(game_loop(game_cls, seed, inputs, **options))
+
+async def run_game_async(game_cls, seed=None, inputs=None, **options):
+    return await drive_async(game_loop(game_cls, seed, inputs, **options))
+
+def game_loop(game_cls, seed=None, inputs=None, **options):
+    # The game ticks at game.fps on a fixed timestep while frames render at
+    # up to DISPLAY_FPS. Events polled between ticks are held for the next
+    # one. `inputs` replaces the event queue with recorded InputFrames, one
+    # per tick; live sessions also get the game's live_options().
+    start = time.perf_counter()
+    if seed is None:
+        seed = random.randrange(1 << 32)
+    if inputs is None:
+        options = {**game_cls.live_options(), **options}
+    game = game_cls(seed, **options)
+    if recorder and inputs is None: recorder.start(game, seed)
+    if game.caption: pygame.display.set_caption(game.caption)
+    allow_events(game.input_events if inputs is None else ())
+    stepper = FixedStep(game.fps)
+    render_fps = max(game.fps, DISPLAY_FPS)
+    pending = []
+    first_frame = True
+    try:
+        while True:
+            if profiler.active: profiler.begin()
+            if inputs is None:
+                polled = poll_input()
+                if polled.quit: return game
+                pending += polled.events
+                events = polled.events
+            else:
+                pygame.event.pump()
+                events = ()
+            for e in events:
+                if e.type == pygame.KEYDOWN and e.key == PROFILER_KEY:
+                    profiler.toggle_overlay()
+                    if game.dirty: game.dirty.mark_all()
+            if game.dirty and any(e.type in EXPOSE_EVENTS for e in events):
+                game.dirty.mark_all()
+            if profiler.active: profiler.mark("events")
+            for _ in range(1 if HEADLESS else stepper.advance(time.perf_counter() * 1000)):
+                if inputs is None:
+                    inp = InputFrame(pending, polled.keys, polled.mouse)
+                    pending = []
+                    if recorder: recorder.record(inp)
+                else:
+                    inp = next(inputs, None)
+                    if inp is None or inp.quit: return game
+                if not game.step(inp): return game
+            if profiler.active: profiler.mark("update")
+            if HEADLESS:
+                game.draw(screen)
+                yield 0
+                continue
+            game.alpha = stepper.alpha
+            present(game)
+            if profiler.active: profiler.mark("present")
+            if first_frame:
+                record_timing("switch_ms", start)
+                first_frame = False
+            yield render_fps
+            if profiler.active: profiler.end()
+    finally:
+        game.close()
+        allow_events()
+        if game.caption: pygame.display.set_caption("Game Hub")
+        if recorder: recorder.stop()
+        profiler.write_trace()
+
+def as_script(script):
+    # A script is a sequence of InputFrames or a callable (game, tick) -> InputFrame
+    if callable(script): return script
+    frames_iter = iter(script)
+    return lambda game, tick: next(frames_iter, IDLE)
+
+def simulate(game_cls, frames, script=(), seed=0, draw=False, **options):
+    # Run a game uncapped without a display
+    game = game_cls(seed, **options)
+    script = as_script(script)
+    ticks = 0
+    while ticks < frames:
+        inp = script(game, ticks)
+        ticks += 1
+        if inp.quit or not game.step(inp): break
+        if draw: game.draw(screen)
+    return ticks, game
+
+def count_allocations(game_cls, frames, seed=0, warmup=60, **options):
+    # Net allocated memory blocks per tick and gen-0 GC runs over `frames`
+    # ticks of the game's bot, restarting it on the next seed when it ends.
+    # Each game's construction and first `warmup` ticks are left out. Both
+    # stay at zero when the loop is allocation-free
+    stats = gc.get_stats
+    blocks = gc_runs = ticks = games = 0
+    while ticks < frames and games <= frames:
+        game, bot = game_cls(seed + games, **options), make_bot(game_cls)
+        games += 1
+        tick = 0
+        while tick < warmup and game.step(bot(game, tick)):
+            tick += 1
+        if tick < warmup: continue
+        # Garbage from the previous game goes now, not mid-count
+        gc.collect()
+        start_blocks, start_runs = sys.getallocatedblocks(), stats()[0]["collections"]
+        while ticks < frames:
+            ticks += 1
+            tick += 1
+            if not game.step(bot(game, tick)): break
+        blocks += sys.getallocatedblocks() - start_blocks
+        gc_runs += stats()[0]["collections"] - start_runs
+    return {"frames": ticks, "games": games,
+            "blocks_per_frame": blocks / ticks if ticks else 0.0,
+            "gc_collections": gc_runs}
+
+# -------- Entity pool --------
+class Pool:
+    # Free list of reusable objects, filled up front; acquire() only builds a
+    # new object when all of them are in use, and counts it in allocations
+    def __init__(self, factory, capacity):
+        self.factory = factory
+        self.free = [factory() for _ in range(capacity)]
+        self.allocations = 0
+
+    def acquire(self):
+        if self.free:
+            return self.free.pop()
+        self.allocations += 1
+        return self.factory()
+
+    def release(self, item):
+        self.free.append(item)
+
+# -------- Text cache --------
+class TextCache:
+    # LRU cache of rendered text surfaces keyed by (font, text, color,
+    # antialias). Pinned entries (preloaded text) sit outside the LRU and
+    # are never evicted.
+    def __init__(self, maxsize=512):
+        self.maxsize = maxsize
+        self.surfaces = OrderedDict()
+        self.pinned = {}
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        key = (font, text, color, antialias)
+        surface = self.pinned.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = self.surfaces[key] = font.render(text, antialias, color)
+        if len(self.surfaces) > self.maxsize:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def pin(self, font, text, color, antialias=True):
+        key = (font, text, color, antialias)
+        if key not in self.pinned:
+            self.pinned[key] = self.surfaces.pop(key, None) or font.render(text, antialias, color)
+
+    def clear(self):
+        self.surfaces.clear()
+        self.pinned.clear()
+        self.hits = self.misses = 0
+
+text_cache = TextCache()
+# Counters that change as the game runs (scores, distance, money) get their
+# own small cache, so a new string every tick cannot evict the static text
+hud_cache = TextCache(maxsize=16)
+
+def render_text(font, text, color, antialias=True):
+    return text_cache.render(font, text, color, antialias)
+
+def render_hud(font, text, color, antialias=True):
+    return hud_cache.render(font, text, color, antialias)
+
+def pin_text(font, text, color, antialias=True):
+    # For preload(): render `text` into the shared cache for good
+    text_cache.pin(font, text, color, antialias)
+
+# -------- Sprite atlas --------
+class SpriteAtlas:
+    # Shapes rasterized once into display-format surfaces, keyed by shape,
+    # size and colors: convert() for opaque rects, convert_alpha() for shapes
+    # with transparent corners. Games look theirs up in __init__ and draw
+    # them with Surface.blits() instead of per-shape pygame.draw calls.
+    # prepare() rasterizes without the display, for the preload thread; the
+    # conversion waits for the first get() on the main thread.
+    def __init__(self):
+        self.sprites = {}
+        self.prepared = {}
+
+    def get(self, shape, w, h, color, outline=None):
+        key = (shape, w, h, color, outline)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            raw = self.prepared.pop(key, None) or self.rasterize(shape, w, h, color, outline)
+            sprite = self.sprites[key] = raw.convert_alpha() if raw.get_flags() & pygame.SRCALPHA else raw.convert()
+        return sprite
+
+    def prepare(self, shape, w, h, color, outline=None):
+        key = (shape, w, h, color, outline)
+        if key not in self.sprites and key not in self.prepared:
+            self.prepared[key] = self.rasterize(shape, w, h, color, outline)
+
+    def rasterize(self, shape, w, h, color, outline):
+        # Unconverted surface: SRCALPHA unless opaque
+        if shape == "rect" and color is not None:
+            sprite = pygame.Surface((w, h))
+            sprite.fill(color)
+            if outline: pygame.draw.rect(sprite, outline, (0, 0, w, h), 2)
+            return sprite
+        if shape == "rect":
+            # Outline only
+            sprite = pygame.Surface((w, h), pygame.SRCALPHA)
+            pygame.draw.rect(sprite, outline, (0, 0, w, h), 2)
+        elif shape == "spike":
+            # Filled polygons cover their right and bottom edges too
+            sprite = pygame.Surface((w + 1, h + 1), pygame.SRCALPHA)
+            pygame.draw.polygon(sprite, color, [(0, h), (w // 2, 0), (w, h)])
+        elif shape == "ellipse":
+            sprite = pygame.Surface((w, h), pygame.SRCALPHA)
+            pygame.draw.ellipse(sprite, color, (0, 0, w, h))
+        elif shape == "vline":
+            sprite = pygame.Surface((w, h), pygame.SRCALPHA)
+            pygame.draw.aaline(sprite, color, (0, 0), (0, h))
+        else:
+            raise ValueError(f"unknown sprite shape {shape!r}")
+        return sprite
+
+atlas = SpriteAtlas()
+
+fade_layer = pygame.Surface((WIDTH, HEIGHT)).convert()
+
+def transition_effect(text="Loading", duration=1200, preload=None):
+    drive(transition_loop(text, duration, preload))
+
+def transition_loop(text="Loading", duration=1200, preload=None):
+    # Fade out for at least `duration` ms while `preload` runs in a worker
+    # thread; ends once both are done. Worker errors surface here.
+    labels = []
+    for dots in range(4):
+        label = render_text(font, text + "." * dots, (255, 255, 255))
+        labels.append((label, (WIDTH // 2 - label.get_width() // 2, HEIGHT // 2 - 20)))
+    errors = []
+
+    def work():
+        try:
+            preload()
+        except Exception as e:
+            errors.append(e)
+
+    worker = None
+    if preload and THREADS:
+        worker = threading.Thread(target=work, name="preload", daemon=True)
+        worker.start()
+    elif preload:
+        work()
+    start = get_ticks()
+    while True:
+        elapsed = get_ticks() - start
+        fade_layer.set_alpha(min(255, 255 * elapsed // duration))
+        # "Loading", "Loading.", "Loading..", "Loading..."
+        label, pos = labels[elapsed // 300 % 4]
+        screen.fill((20, 20, 30))
+        screen.blit(label, pos)
+        screen.blit(fade_layer, (0, 0))
+
+        show()
+        pygame.event.pump()
+        if elapsed >= duration and not (worker and worker.is_alive()):
+            break
+        yield 60
+    if errors:
+        raise errors[0]
+
+# -------- Snake Game --------
+class Snake(Game):
+    fps = 10
+    BLOCK = 20
+    SCORE_RECT = (0, 0, 200, 40)
+    sprites = (("rect", BLOCK, BLOCK, (0, 255, 0)), ("rect", BLOCK, BLOCK, (255, 0, 0)))
+
+    def __init__(self, seed=None, cols=WIDTH // BLOCK, rows=HEIGHT // BLOCK):
+        super().__init__(seed)
+        self.cols, self.rows = cols, rows
+        self.cell = max(1, min(WIDTH // cols, HEIGHT // rows))
+        # Body as a deque of cell indices plus an occupancy bitmap, and a
+        # swap-remove list of free cells so moves and apple respawns are O(1)
+        self.occupied = bytearray(cols * rows)
+        self.free = array("i", range(cols * rows))
+        self.free_pos = array("i", range(cols * rows))
+        start = rows // 2 * cols + cols // 2
+        self.snake = deque()
+        self.dirty = DirtyRects()
+        self.occupy(start)
+        self.direction = (1, 0)
+        self.apple = self.random_cell()
+        self.score = 0
+        self.body_sprite = atlas.get("rect", self.cell, self.cell, (0, 255, 0))
+        self.apple_sprite = atlas.get("rect", self.cell, self.cell, (255, 0, 0))
+
+    def cell_rect(self, cell):
+        y, x = divmod(cell, self.cols)
+        return (x * self.cell, y * self.cell, self.cell, self.cell)
+
+    def occupy(self, cell):
+        self.dirty.mark(self.cell_rect(cell))
+        self.occupied[cell] = 1
+        self.snake.appendleft(cell)
+        free, free_pos = self.free, self.free_pos
+        i, last = free_pos[cell], free[-1]
+        free[i] = last
+        free_pos[last] = i
+        free.pop()
+
+    def vacate(self):
+        cell = self.snake.pop()
+        self.dirty.mark(self.cell_rect(cell))
+        self.occupied[cell] = 0
+        self.free_pos[cell] = len(self.free)
+        self.free.append(cell)
+
+    def random_cell(self):
+        if not self.free: return None
+        return self.free[self.rng.randrange(len(self.free))]
+
+    def update(self, inp):
+        for e in inp.events:
+            if e.type == pygame.KEYDOWN:
+                if e.key == pygame.K_UP: self.direction = (0, -1)
+                elif e.key == pygame.K_DOWN: self.direction = (0, 1)
+                elif e.key == pygame.K_LEFT: self.direction = (-1, 0)
+                elif e.key == pygame.K_RIGHT: self.direction = (1, 0)
+
+        y, x = divmod(self.snake[0], self.cols)
+        x += self.direction[0]
+        y += self.direction[1]
+        if not (0 <= x < self.cols and 0 <= y < self.rows): return False
+        head = y * self.cols + x
+        if self.occupied[head]: return False
+        self.occupy(head)
+        if head == self.apple:
+            self.score += 1
+            self.dirty.mark(self.SCORE_RECT)
+            self.apple = self.random_cell()
+            if self.apple is None: return False  # Board full
+            self.dirty.mark(self.cell_rect(self.apple))
+        else:
+            self.vacate()
+        return True
+
+    def draw(self, surface):
+        surface.fill((0, 0, 0))
+        if self.apple is not None:
+            surface.blit(self.apple_sprite, self.cell_rect(self.apple))
+        body, cell_rect = self.body_sprite, self.cell_rect
+        surface.blits([(body, cell_rect(s)) for s in self.snake], doreturn=False)
+        score_text = render_hud(font, f"Score: {self.score}", (255,255,255))
+        surface.blit(score_text, (10,10))
+
+def run_snake():
+    run_game(Snake)
+
+# -------- Falling obstacles (Dodge, Asteroids) --------
+class FallingObstacles:
+    # Obstacles that all fall at one speed. Positions are kept as x and a
+    # base y (screen y = base + offset) in int64 arrays used as a ring buffer
+    # ordered from lowest on screen to highest, so a move is one offset
+    # increment, recycling pops from the front and only the front band is
+    # tested against the player.
+    # Since they fall together, the picture they make only changes at the
+    # top: each obstacle is stamped once, as it comes into view, onto a layer
+    # used as a vertical ring in base coordinates, and draw() blits the
+    # visible window of it. Drawing costs the same for 10 or 30k obstacles.
+    LAYER_KEY = (255, 0, 255)
+    LAYER_ROWS = 2 * HEIGHT
+
+    def __init__(self, rng, count, size, speed, color, spacing=60):
+        self.rng = rng
+        self.size = size
+        self.speed = speed
+        self.color = color
+        self.offset = 0
+        capacity = 16
+        while capacity < count: capacity *= 2
+        self.xs = array("q", bytes(8 * capacity))
+        self.bases = array("q", bytes(8 * capacity))
+        self.head = 0
+        self.count = 0
+        for i in range(count):
+            self.push(self.random_x(), -spacing * i)
+        # Built on the first draw: simulations never pay for it
+        self.layer = None
+        # Obstacles based below layer_top are on the layer; they are the
+        # first `stamped` in the ring
+        self.layer_top = None
+        self.stamped = 0
+
+    def random_x(self):
+        return self.rng.randint(0, WIDTH - self.size)
+
+    def push(self, x, base):
+        if self.count == len(self.xs):
+            self.grow()
+        i = (self.head + self.count) & (len(self.xs) - 1)
+        self.xs[i] = x
+        self.bases[i] = base
+        self.count += 1
+
+    def grow(self):
+        capacity = len(self.xs)
+        head = self.head
+        self.xs = self.xs[head:] + self.xs[:head] + array("q", bytes(8 * capacity))
+        self.bases = self.bases[head:] + self.bases[:head] + array("q", bytes(8 * capacity))
+        self.head = 0
+
+    def top_base(self):
+        # Enter at y = -size, but never below the highest queued obstacle,
+        # which keeps the ring sorted
+        base = -self.size - self.offset
+        if self.count:
+            last = self.bases[(self.head + self.count - 1) & (len(self.xs) - 1)]
+            base = min(base, last)
+        return base
+
+    def spawn(self):
+        self.push(self.random_x(), self.top_base())
+
+    def add(self, n, spread):
+        # n more obstacles, scattered over `spread` rows above the queue
+        top = self.top_base()
+        for d in sorted(self.rng.randrange(spread) for _ in range(n)):
+            self.push(self.random_x(), top - d)
+
+    def advance(self):
+        # Move every obstacle and recycle those below the screen to the top;
+        # returns how many were recycled
+        self.offset += self.speed
+        recycled = 0
+        mask = len(self.xs) - 1
+        while self.count and self.bases[self.head] + self.offset > HEIGHT:
+            self.head = (self.head + 1) & mask
+            self.count -= 1
+            if self.stamped: self.stamped -= 1
+            self.spawn()
+            recycled += 1
+        return recycled
+
+    def collides(self, rect):
+        xs, bases, offset, size = self.xs, self.bases, self.offset, self.size
+        mask = len(xs) - 1
+        left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+        for k in range(self.count):
+            i = (self.head + k) & mask
+            y = bases[i] + offset
+            if y + size <= top: break
+            if y < bottom and xs[i] < right and left < xs[i] + size:
+                return True
+        return False
+
+    def fill_layer(self, color, x, base, w, h):
+        # Fill rows base..base + h of the ring layer, wrapping at its bottom
+        rows = self.LAYER_ROWS
+        y = base % rows
+        self.layer.fill(color, (x, y, w, min(h, rows - y)))
+        if y + h > rows:
+            self.layer.fill(color, (x, 0, w, y + h - rows))
+
+    def draw(self, surface):
+        size, rows = self.size, self.LAYER_ROWS
+        if self.layer is None:
+            self.layer = pygame.Surface((WIDTH, rows)).convert()
+            self.layer.set_colorkey(self.LAYER_KEY)
+        # Obstacles based at or above `top` are still off screen
+        top = -self.offset - size
+        if self.layer_top is None or self.layer_top - top > rows - HEIGHT - 2 * size:
+            self.layer.fill(self.LAYER_KEY)
+            self.stamped = 0
+        elif top < self.layer_top:
+            # Rows coming into view last held obstacles long gone
+            self.fill_layer(self.LAYER_KEY, 0, top + 1, WIDTH, self.layer_top - top)
+        self.layer_top = top
+        xs, bases, sprite = self.xs, self.bases, atlas.get("rect", size, size, self.color)
+        mask = len(xs) - 1
+        k = self.stamped
+        batch = []
+        while k < self.count:
+            i = (self.head + k) & mask
+            base = bases[i]
+            if base <= top: break
+            y = base % rows
+            if y + size <= rows:
+                batch.append((sprite, (xs[i], y)))
+            else:
+                self.fill_layer(self.color, xs[i], base, size, size)
+            k += 1
+        self.layer.blits(batch, doreturn=False)
+        self.stamped = k
+        # Screen row 0 is base -offset
+        y = -self.offset % rows
+        first = min(HEIGHT, rows - y)
+        surface.blit(self.layer, (0, 0), (0, y, WIDTH, first))
+        if first < HEIGHT:
+            surface.blit(self.layer, (0, first), (0, 0, WIDTH, HEIGHT - first))
+
+# -------- Dodge Game --------
+class Dodge(Game):
+    sprites = (("rect", 40, 40, (0, 255, 0)), ("rect", 30, 30, (255, 0, 0)))
+
+    def __init__(self, seed=None, count=10, ramp=0.05):
+        super().__init__(seed)
+        self.player = pygame.Rect(WIDTH//2, HEIGHT-50, 40, 40)
+        self.player_sprite = atlas.get("rect", 40, 40, (0, 255, 0))
+        self.blocks = FallingObstacles(self.rng, count, 30, 5, (255,0,0))
+        # Difficulty ramp: the block count grows by `ramp` each second (0
+        # disables); at 5% it passes 10k after about 140 s and 30k after 160 s
+        self.ramp = ramp
+        self.ticks = 0
+        self.score = 0
+
+    def update(self, inp):
+        player = self.player
+        keys = inp.keys
+        if keys[pygame.K_LEFT] and player.left > 0: player.move_ip(-5, 0)
+        if keys[pygame.K_RIGHT] and player.right < WIDTH: player.move_ip(5, 0)
+
+        self.ticks += 1
+        if self.ramp and self.ticks % self.fps == 0:
+            # Spread over the next second of fall, so they arrive evenly
+            blocks = self.blocks
+            blocks.add(max(1, int(blocks.count * self.ramp)), blocks.speed * self.fps)
+        self.score += self.blocks.advance()
+        return not self.blocks.collides(player)
+
+    def draw(self, surface):
+        surface.fill((0, 0, 0))
+        surface.blit(self.player_sprite, self.player)
+        self.blocks.draw(surface)
+        score_text = render_hud(font, f"Score: {self.score}", (255,255,255))
+        surface.blit(score_text, (10,10))
+
+def run_dodge():
+    run_game(Dodge)
+# -------- Main Menu --------
+MENU_PARTICLES = 40
+MENU_FPS, MENU_IDLE_FPS, MENU_HIDDEN_FPS = 60, 15, 4
+MENU_IDLE_MS = 5000  # Without input for this long, the menu drops to MENU_IDLE_FPS
+
+class MenuParticles:
+    # Cubes drifting left at one speed. Like FallingObstacles, x is a base
+    # (screen x = base - offset) in arrays used as a ring sorted by base, so
+    # motion is one offset update and recycling rewrites the front slot as the
+    # new back. The offset comes from elapsed time, not frames.
+    SPEED = 60  # px per second
+
+    def __init__(self, rng, count, size=20, color=(50, 255, 255)):
+        self.rng = rng
+        self.size = size
+        self.bases = array("q", sorted(rng.randint(0, WIDTH) for _ in range(count)))
+        self.ys = array("q", (rng.randint(0, HEIGHT) for _ in range(count)))
+        self.head = 0
+        self.offset = 0
+        self.sprite = pygame.Surface((size, size)).convert()
+        self.sprite.fill(color)
+
+    def advance(self, ms):
+        offset = self.offset = ms * self.SPEED // 1000
+        bases, ys, rng = self.bases, self.ys, self.rng
+        while bases and bases[self.head] - offset < -self.size:
+            # Re-enter past the right edge, never before the last cube
+            bases[self.head] = max(offset + WIDTH + rng.randint(0, 100), bases[self.head - 1])
+            ys[self.head] = rng.randint(0, HEIGHT - self.size)
+            self.head = (self.head + 1) % len(bases)
+
+    def draw(self, surface):
+        offset, sprite = self.offset, self.sprite
+        surface.blits([(sprite, (base - offset, y)) for base, y in zip(self.bases, self.ys) if base - offset < WIDTH],
+                      doreturn=False)
+
+menu_buttons = {}
+
+def menu_button(name, selected):
+    # Menu entries are prerendered once per state
+    key = (name, selected)
+    if key not in menu_buttons:
+        button = pygame.Surface((400, 50)).convert()
+        button.fill((0, 200, 255) if selected else (80, 80, 120))
+        button.blit(render_text(font, name, (255, 255, 255)), (20, 10))
+        menu_buttons[key] = button
+    return menu_buttons[key]
+
+def main_menu():
+    drive(menu_loop())
+
+async def main_menu_async():
+    await drive_async(menu_loop())
+
+def menu_loop():
+    WIDTH, HEIGHT = 800, 600
+    running = True
+    games = GAMES
+    selected_index = 0
+    visible_limit = 6
+    scroll_offset = 0
+
+    # Background animation
+    start = last_input = get_ticks()
+    particles = MenuParticles(random.Random(), MENU_PARTICLES)
+
+    while True:
+        ticks = get_ticks()
+
+        # Handle input
+        for event in poll_input().events:
+            if event.type == pygame.QUIT:
+                return
+            elif event.type == pygame.KEYDOWN:
+                last_input = ticks
+                if event.key == pygame.K_UP:
+                    if selected_index > 0:
+                        selected_index -= 1
+                        if selected_index < scroll_offset:
+                            scroll_offset -= 1
+                elif event.key == pygame.K_DOWN:
+                    if selected_index < len(games) - 1:
+                        selected_index += 1
+                        if selected_index >= scroll_offset + visible_limit:
+                            scroll_offset += 1
+                elif event.key == pygame.K_RETURN:
+                    name, _, game_cls = games[selected_index]
+                    options = game_cls.live_options()
+                    yield from transition_loop(f"Loading {name}", preload=lambda: game_cls.preload(**options))
+                    yield from game_loop(game_cls, **options)
+                    ticks = last_input = get_ticks()
+        if not pygame.display.get_active():
+            # Minimized: just check the queue a few times a second
+            yield MENU_HIDDEN_FPS
+            continue
+
+        # Glowing background color
+        r = 20 + int(20 * math.sin(ticks * 0.002))
+        g = 20 + int(20 * math.sin(ticks * 0.004))
+        b = 30 + int(20 * math.sin(ticks * 0.003))
+        screen.fill((r, g, b))
+
+        # Floating cube animation
+        particles.advance(ticks - start)
+        particles.draw(screen)
+
+        # Draw menu items
+        items = games[scroll_offset:scroll_offset + visible_limit]
+        screen.blits([(menu_button(name, scroll_offset + i == selected_index), (200, 120 + i * 60))
+                      for i, (name, _, _) in enumerate(items)], doreturn=False)
+
+        # Scrollbar indicator
+        info = render_text(font, f"{selected_index + 1}/{len(games)}", (180, 180, 200))
+        screen.blit(info, (WIDTH - 120, HEIGHT - 40))
+
+        show()
+        yield MENU_FPS if ticks - last_input < MENU_IDLE_MS else MENU_IDLE_FPS
+
+class Flappy(Game):
+    PIPE_SPEED = 5
+    sprites = (("rect", 30, 30, (255, 255, 0)), ("rect", 50, HEIGHT, (0, 255, 0)))
+
+    def __init__(self, seed=None):
+        super().__init__(seed)
+        self.bird = pygame.Rect(100, HEIGHT//2, 30, 30)
+        self.prev_y = self.bird.y
+        self.gravity = 0
+        self.bird_sprite = atlas.get("rect", 30, 30, (255, 255, 0))
+        # One screen-tall pipe; each pipe blits the part it needs
+        self.pipe_sprite = atlas.get("rect", 50, HEIGHT, (0, 255, 0))
+        # Pipes leave the screen in spawn order, so the active ones are a
+        # FIFO of Rects recycled through a pool
+        self.pipe_pool = Pool(lambda: pygame.Rect(0, 0, 0, 0), 8)
+        self.pipes = deque()
+        self.pipe_timer = 0
+        self.score = 0
+
+    def update(self, inp):
+        bird = self.bird
+        self.prev_y = bird.y
+        self.gravity += 1
+        bird.y += self.gravity // 3
+        if bird.bottom < 0 or bird.top > HEIGHT: return False
+
+        self.pipe_timer += 1
+        if self.pipe_timer > 60:
+            h = self.rng.randint(100, 400)
+            self.spawn_pipe(WIDTH, 0, 50, h)
+            self.spawn_pipe(WIDTH, h + 150, 50, HEIGHT - h - 150)
+            self.pipe_timer = 0
+
+        for p in self.pipes:
+            p.x -= self.PIPE_SPEED
+            if p.colliderect(bird): return False
+
+        while self.pipes and self.pipes[0].x <= -50:
+            self.pipe_pool.release(self.pipes.popleft())
+        self.score += 0.01
+
+        for e in inp.events:
+            if e.type == pygame.KEYDOWN:
+                if e.key == pygame.K_SPACE: self.gravity = -25
+        return True
+
+    def spawn_pipe(self, x, y, w, h):
+        pipe = self.pipe_pool.acquire()
+        pipe.update(x, y, w, h)
+        self.pipes.append(pipe)
+
+    def draw(self, surface):
+        bird = self.bird
+        surface.fill((135, 206, 235))
+        surface.blit(self.bird_sprite, (bird.x, round(self.lerp(self.prev_y, bird.y))))
+        # Pipes were PIPE_SPEED further right a tick ago
+        shift, pipe = round(self.lerp(self.PIPE_SPEED, 0)), self.pipe_sprite
+        surface.blits([(pipe, (p.x + shift, p.y), (0, 0, p.w, p.h)) for p in self.pipes], doreturn=False)
+
+        score_text = render_hud(font, f"Score: {int(self.score)}", (255,255,255))
+        surface.blit(score_text, (10,10))
+
+def run_flappy():
+    run_game(Flappy)
+
+class Breakout(Game):
+    BRICK_COLORS = {1: (255, 0, 0), 2: (255, 140, 0), 3: (255, 220, 0)}
+    LEFT, TOP = 20, 40
+    sprites = (("rect", 15, 15, (255, 255, 255)), ("rect", 120, 10, (200, 200, 200)))
+
+    def __init__(self, seed=None, cols=13, rows=5, max_hits=1):
+        super().__init__(seed)
+        self.ball = pygame.Rect(WIDTH//2, HEIGHT//2, 15, 15)
+        self.paddle = pygame.Rect(WIDTH//2 - 60, HEIGHT - 30, 120, 10)
+        # Bricks live in a cols x rows grid of remaining hit counts; the ball
+        # only tests the cells it overlaps and removal is a counter decrement
+        self.cols, self.rows = cols, rows
+        self.cell_w = (WIDTH - self.LEFT) // cols
+        self.cell_h = min(20, (HEIGHT // 2 - self.TOP) // rows)
+        self.brick_w = self.cell_w * 5 // 6
+        self.brick_h = self.cell_h * 3 // 4
+        if max_hits > 1:
+            self.hits = bytearray(self.rng.randint(1, max_hits) for _ in range(cols * rows))
+        else:
+            self.hits = bytearray([1]) * (cols * rows)
+        self.bricks_left = cols * rows
+        self.dx, self.dy = 4, -4
+        self.score = 0
+        # Bricks are drawn once onto a layer; hit cells are repainted in draw()
+        self.layer = None
+        self.changed = []
+        self.ball_sprite = atlas.get("rect", self.ball.w, self.ball.h, (255, 255, 255))
+        self.paddle_sprite = atlas.get("rect", self.paddle.w, self.paddle.h, (200, 200, 200))
+
+    def brick_rect(self, cell):
+        row, col = divmod(cell, self.cols)
+        return pygame.Rect(self.LEFT + col * self.cell_w, self.TOP + row * self.cell_h, self.brick_w, self.brick_h)
+
+    def hit_brick(self, ball, prev_x, prev_y):
+        col0 = max(0, (ball.left - self.LEFT) // self.cell_w)
+        col1 = min(self.cols - 1, (ball.right - 1 - self.LEFT) // self.cell_w)
+        row0 = max(0, (ball.top - self.TOP) // self.cell_h)
+        row1 = min(self.rows - 1, (ball.bottom - 1 - self.TOP) // self.cell_h)
+        for row in range(row0, row1 + 1):
+            for col in range(col0, col1 + 1):
+                cell = row * self.cols + col
+                if not self.hits[cell]: continue
+                brick = self.brick_rect(cell)
+                if not ball.colliderect(brick): continue
+                self.hits[cell] -= 1
+                if not self.hits[cell]:
+                    self.bricks_left -= 1
+                self.changed.append(cell)
+                self.score += 1
+                # Reflect on the axis the ball crossed into the brick
+                if prev_x + ball.width <= brick.left or prev_x >= brick.right:
+                    if not (prev_y + ball.height <= brick.top or prev_y >= brick.bottom):
+                        self.dx *= -1
+                        return
+                self.dy *= -1
+                return
+
+    def update(self, inp):
+        ball, paddle = self.ball, self.paddle
+        prev_x, prev_y = ball.x, ball.y
+        ball.x += self.dx
+        ball.y += self.dy
+
+        if ball.left <= 0 or ball.right >= WIDTH: self.dx *= -1
+        if ball.top <= 0: self.dy *= -1
+        if ball.bottom >= HEIGHT: return False
+
+        if ball.colliderect(paddle): self.dy *= -1
+        if ball.top < self.TOP + self.rows * self.cell_h and ball.bottom > self.TOP:
+            self.hit_brick(ball, prev_x, prev_y)
+
+        keys = inp.keys
+        if keys[pygame.K_LEFT] and paddle.left > 0: paddle.move_ip(-6, 0)
+        if keys[pygame.K_RIGHT] and paddle.right < WIDTH: paddle.move_ip(6, 0)
+        return True
+
+    def paint_brick(self, cell):
+        hits = self.hits[cell]
+        color = self.BRICK_COLORS.get(hits, self.BRICK_COLORS[3]) if hits else (0, 0, 0)
+        self.layer.fill(color, self.brick_rect(cell))
+
+    def draw(self, surface):
+        if self.layer is None:
+            self.layer = pygame.Surface((WIDTH, HEIGHT)).convert()
+            self.layer.set_colorkey((0, 0, 0))
+            for cell in range(self.cols * self.rows):
+                self.paint_brick(cell)
+            self.changed.clear()
+        for cell in self.changed:
+            self.paint_brick(cell)
+        self.changed.clear()
+
+        surface.fill((0, 0, 0))
+        surface.blits(((self.ball_sprite, self.ball), (self.paddle_sprite, self.paddle), (self.layer, (0, 0))),
+                      doreturn=False)
+
+        score_text = render_hud(font, f"Score: {self.score}", (255,255,255))
+        surface.blit(score_text, (10,10))
+
+def run_breakout():
+    run_game(Breakout)
+
+def bounce(y, span):
+    # Fold a coordinate that moved freely between walls at 0 and span back
+    # into range; returns (position, whether the direction ended up flipped)
+    laps = math.floor(y / span)
+    y -= laps * span
+    if laps % 2:
+        return span - y, True
+    return y, False
+
+class Pong(Game):
+    WHITE, BLACK = (255, 255, 255), (0, 0, 0)
+    PADDLE_WIDTH, PADDLE_HEIGHT = 10, 100
+    BALL_RADIUS = 10
+    PADDLE_SPEED = 6
+    WINNING_SCORE = 10
+    # AI paddle speeds calibrated by tune_pong.py against a predictive
+    # opponent moving at PADDLE_SPEED (computer wins ~25/50/75/95%)
+    DIFFICULTIES = [
+        ("1. Easy", 4.9),
+        ("2. Medium", 6.0),
+        ("3. Hard", 6.6),
+        ("4. Impossible", 7.7)
+    ]
+    # Max aiming error (pixels) times paddle speed: slower AIs also aim worse.
+    # Drawn once per plan
+    AI_ERROR = 600
+    sprites = (("rect", PADDLE_WIDTH, PADDLE_HEIGHT, WHITE), ("ellipse", BALL_RADIUS * 2, BALL_RADIUS * 2, WHITE),
+               ("vline", 1, HEIGHT, WHITE))
+
+    def __init__(self, seed=None, single_player=None, ai_speed=0, left_ai_speed=0):
+        super().__init__(seed)
+        self.font = get_font(36)
+        self.win_font = get_font(72)
+        self.menu_font = get_font(48)
+        # "mode" -> "difficulty" -> "play"; skip the menus when the mode is given
+        self.phase = "mode" if single_player is None else "play"
+        self.single_player = single_player
+        self.ai_speed = ai_speed
+        # Self-play: the left paddle is also computer-controlled when set
+        self.left_ai_speed = left_ai_speed
+        self.winner = None
+        self.paddle_sprite = atlas.get("rect", self.PADDLE_WIDTH, self.PADDLE_HEIGHT, self.WHITE)
+        self.ball_sprite = atlas.get("ellipse", self.BALL_RADIUS * 2, self.BALL_RADIUS * 2, self.WHITE)
+        self.net_sprite = atlas.get("vline", 1, HEIGHT, self.WHITE)
+        self.reset_match()
+
+    def reset_match(self):
+        PADDLE_WIDTH, PADDLE_HEIGHT, BALL_RADIUS = self.PADDLE_WIDTH, self.PADDLE_HEIGHT, self.BALL_RADIUS
+        self.player1 = pygame.Rect(10, HEIGHT//2 - PADDLE_HEIGHT//2, PADDLE_WIDTH, PADDLE_HEIGHT)
+        self.player2 = pygame.Rect(WIDTH - 20, HEIGHT//2 - PADDLE_HEIGHT//2, PADDLE_WIDTH, PADDLE_HEIGHT)
+        self.ball = pygame.Rect(WIDTH//2 - BALL_RADIUS, HEIGHT//2 - BALL_RADIUS, BALL_RADIUS*2, BALL_RADIUS*2)
+        # Exact (float) top-left of the ball; self.ball is its rounded copy
+        self.bx, self.by = self.ball.topleft
+        self.prev_ball = (self.bx, self.by)
+        self.ball_speed = [5 * self.rng.choice((1, -1)), 5 * self.rng.choice((1, -1))]
+        self.score1, self.score2 = 0, 0
+        self.ai_y = [float(self.player1.y), float(self.player2.y)]
+        self.ai_plan = [None, None]
+
+    def reset_ball(self):
+        self.ball.center = (WIDTH // 2, HEIGHT // 2)
+        self.bx, self.by = self.ball.topleft
+        self.prev_ball = (self.bx, self.by)
+        self.ai_plan = [None, None]
+        self.ball_speed[0] = 5 * self.rng.choice((1, -1))
+        self.ball_speed[1] = 5 * self.rng.choice((1, -1))
+
+    def predict_intercept(self, face_x):
+        # Ball centre y when its leading edge reaches face_x, walls included
+        size = self.BALL_RADIUS * 2
+        vx, vy = self.ball_speed
+        edge = self.bx + size if vx > 0 else self.bx
+        t = (face_x - edge) / vx
+        return bounce(self.by + vy * t, HEIGHT - size)[0] + size / 2
+
+    def ai_move(self, side, speed):
+        # Predictive AI for side 0 (left) or 1 (right): while the ball comes
+        # its way, head for the predicted intercept, planned once per serve or
+        # paddle hit; otherwise drift back to the middle
+        paddle = self.player2 if side else self.player1
+        vx = self.ball_speed[0]
+        if (vx > 0) == bool(side):
+            if self.ai_plan[side] is None:
+                face = paddle.left if side else paddle.right
+                spread = self.AI_ERROR / speed
+                error = self.rng.uniform(-spread, spread)
+                self.ai_plan[side] = self.predict_intercept(face) + error
+            target = self.ai_plan[side]
+        else:
+            self.ai_plan[side] = None
+            target = HEIGHT / 2
+        y = self.ai_y[side]
+        y += max(-speed, min(speed, target - paddle.height / 2 - y))
+        y = max(0, min(HEIGHT - paddle.height, y))
+        self.ai_y[side] = y
+        paddle.y = round(y)
+
+    def move_ball(self):
+        # Swept motion: jump straight to each paddle-face impact within the
+        # frame and reflect there, so a fast ball can't tunnel or hit twice.
+        # Wall bounces are folded in closed form by bounce(), so the cost
+        # depends on the number of paddle hits, not on the speed.
+        vx, vy = self.ball_speed
+        size = self.BALL_RADIUS * 2
+        span = HEIGHT - size
+        t = 1.0
+        for _ in range(16):
+            paddle, toi = None, t
+            if vx < 0 and self.bx >= self.player1.right > self.bx + vx * t:
+                paddle, toi = self.player1, (self.player1.right - self.bx) / vx
+            elif vx > 0 and self.bx + size <= self.player2.left < self.bx + size + vx * t:
+                paddle, toi = self.player2, (self.player2.left - size - self.bx) / vx
+            if paddle:
+                y = bounce(self.by + vy * toi, span)[0]
+                if not (y < paddle.bottom and y + size > paddle.top):
+                    paddle, toi = None, t
+            self.bx += vx * toi
+            self.by, flipped = bounce(self.by + vy * toi, span)
+            if flipped: vy = -vy
+            t -= toi
+            if not paddle: break
+            vx *= -1.1
+            vy *= 1.1
+        self.ball_speed[0], self.ball_speed[1] = vx, vy
+        self.ball.topleft = (round(self.bx), round(self.by))
+
+    def update(self, inp):
+        if self.phase == "mode":
+            for event in inp.events:
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_1:
+                        self.single_player = True
+                        self.phase = "difficulty"
+                    elif event.key == pygame.K_2:
+                        self.single_player = False
+                        self.phase = "play"
+            return True
+        if self.phase == "difficulty":
+            for event in inp.events:
+                if event.type == pygame.KEYDOWN:
+                    if event.key in [pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4]:
+                        self.ai_speed = self.DIFFICULTIES[event.key - pygame.K_1][1]
+                        self.phase = "play"
+            return True
+        if self.winner:
+            return True
+
+        player1, player2, ball = self.player1, self.player2, self.ball
+        PADDLE_SPEED = self.PADDLE_SPEED
+        keys = inp.keys
+        if self.left_ai_speed:
+            self.ai_move(0, self.left_ai_speed)
+        else:
+            if keys[pygame.K_w] and player1.top > 0: player1.y -= PADDLE_SPEED
+            if keys[pygame.K_s] and player1.bottom < HEIGHT: player1.y += PADDLE_SPEED
+
+        if self.single_player:
+            self.ai_move(1, self.ai_speed)
+        else:
+            if keys[pygame.K_UP] and player2.top > 0: player2.y -= PADDLE_SPEED
+            if keys[pygame.K_DOWN] and player2.bottom < HEIGHT: player2.y += PADDLE_SPEED
+
+        self.prev_ball = (self.bx, self.by)
+        self.move_ball()
+
+        if ball.left <= 0:
+            self.score2 += 1
+            self.reset_ball()
+        elif ball.right >= WIDTH:
+            self.score1 += 1
+            self.reset_ball()
+
+        if self.score1 >= self.WINNING_SCORE:
+            self.winner = "Player 1 Wins!"
+        elif self.score2 >= self.WINNING_SCORE:
+            self.winner = "Computer Wins!" if self.single_player else "Player 2 Wins!"
+        if self.winner:
+            # Keep showing the final frame and the winner, then leave
+            self.after(3000, self.finish)
+        return True
+
+    def draw(self, surface):
+        WHITE, BLACK = self.WHITE, self.BLACK
+        surface.fill(BLACK)
+        if self.phase == "mode":
+            title = render_text(self.win_font, "PONG", WHITE)
+            surface.blit(title, (WIDTH // 2 - title.get_width() // 2, HEIGHT // 3))
+            single = render_text(self.menu_font, "1. Single Player", WHITE)
+            two = render_text(self.menu_font, "2. Two Player", WHITE)
+            surface.blit(single, (WIDTH // 2 - single.get_width() // 2, HEIGHT // 2))
+            surface.blit(two, (WIDTH // 2 - two.get_width() // 2, HEIGHT // 2 + 60))
+            return
+        if self.phase == "difficulty":
+            title = render_text(self.win_font, "Select AI Difficulty", WHITE)
+            surface.blit(title, (WIDTH // 2 - title.get_width() // 2, HEIGHT // 4))
+            for i, (label, _) in enumerate(self.DIFFICULTIES):
+                txt = render_text(self.menu_font, label, WHITE)
+                surface.blit(txt, (WIDTH // 2 - txt.get_width() // 2, HEIGHT // 2 + i * 50 - 40))
+            return
+
+        paddle, px, py = self.paddle_sprite, *self.prev_ball
+        surface.blits(((paddle, self.player1), (paddle, self.player2),
+                       (self.ball_sprite, (round(self.lerp(px, self.bx)), round(self.lerp(py, self.by)))),
+                       (self.net_sprite, (WIDTH // 2, 0))), doreturn=False)
+
+        score_text1 = render_text(self.font, str(self.score1), WHITE)
+        score_text2 = render_text(self.font, str(self.score2), WHITE)
+        surface.blit(score_text1, (WIDTH//2 - 50, 20))
+        surface.blit(score_text2, (WIDTH//2 + 30, 20))
+
+        if self.winner:
+            win_text = render_text(self.win_font, self.winner, WHITE)
+            surface.blit(win_text, (WIDTH // 2 - win_text.get_width() // 2, HEIGHT // 2 - win_text.get_height() // 2))
+
+    @classmethod
+    def preload(cls, **options):
+        super().preload(**options)
+        win_font, menu_font = get_font(72), get_font(48)
+        for text in ("PONG", "Select AI Difficulty"):
+            pin_text(win_font, text, cls.WHITE)
+        for text in ["1. Single Player", "2. Two Player"] + [label for label, _ in cls.DIFFICULTIES]:
+            pin_text(menu_font, text, cls.WHITE)
+
+def run_pong():
+    run_game(Pong)
+
+class Memory(Game):
+    input_events = (pygame.MOUSEBUTTONDOWN,)
+    ROWS, COLS = 4, 4
+    CARD_SIZE = 100
+    GAP = 20
+    sprites = (("rect", CARD_SIZE, CARD_SIZE, (100, 100, 255), (255, 255, 255)),
+               ("rect", CARD_SIZE, CARD_SIZE, (0, 200, 0), (255, 255, 255)))
+
+    def __init__(self, seed=None):
+        super().__init__(seed)
+        self.font = get_font(36)
+        ROWS, COLS, CARD_SIZE, GAP = self.ROWS, self.COLS, self.CARD_SIZE, self.GAP
+
+        # Grid layout
+        grid_width = COLS * CARD_SIZE + (COLS - 1) * GAP
+        grid_height = ROWS * CARD_SIZE + (ROWS - 1) * GAP
+        start_x = (WIDTH - grid_width) // 2
+        start_y = (HEIGHT - grid_height) // 2
+
+        # Create card positions
+        self.card_positions = []
+        for row in range(ROWS):
+            for col in range(COLS):
+                x = start_x + col * (CARD_SIZE + GAP)
+                y = start_y + row * (CARD_SIZE + GAP)
+                self.card_positions.append(pygame.Rect(x, y, CARD_SIZE, CARD_SIZE))
+
+        # Create card values (2 of each)
+        self.values = list(range(1, (ROWS * COLS) // 2 + 1)) * 2
+        self.rng.shuffle(self.values)
+        self.card_sprites = [atlas.get("rect", CARD_SIZE, CARD_SIZE, color, (255, 255, 255))
+                             for color in ((100, 100, 255), (0, 200, 0))]
+        self.revealed = [False] * len(self.values)
+        self.matched = [False] * len(self.values)
+        self.selection = []
+        self.dirty = DirtyRects()
+
+    def update(self, inp):
+        mx, my = inp.mouse
+        click = any(event.type == pygame.MOUSEBUTTONDOWN for event in inp.events)
+        revealed, matched = self.revealed, self.matched
+
+        # Clicks are ignored while a pair is on show
+        if len(self.selection) == 2: return True
+        for i, rect in enumerate(self.card_positions):
+            if rect.collidepoint((mx, my)) and click and not revealed[i] and not matched[i]:
+                revealed[i] = True
+                self.selection.append(i)
+                self.dirty.mark(rect)
+                if len(self.selection) == 2:
+                    self.after(600, self.check_pair)
+        return True
+
+    def check_pair(self):
+        a, b = self.selection
+        if self.values[a] == self.values[b]:
+            self.matched[a] = self.matched[b] = True
+        else:
+            self.revealed[a] = self.revealed[b] = False
+            self.dirty.mark(self.card_positions[a])
+            self.dirty.mark(self.card_positions[b])
+        self.selection = []
+
+    def draw(self, surface):
+        CARD_SIZE = self.CARD_SIZE
+        surface.fill((20, 20, 30))
+        hidden, shown = self.card_sprites
+        surface.blits([(shown if self.revealed[i] else hidden, rect) for i, rect in enumerate(self.card_positions)],
+                      doreturn=False)
+        for i, rect in enumerate(self.card_positions):
+            if self.revealed[i] or self.matched[i]:
+                txt = render_text(self.font, str(self.values[i]), (255, 255, 255))
+                surface.blit(txt, (rect.x + CARD_SIZE//2 - txt.get_width()//2,
+                                   rect.y + CARD_SIZE//2 - txt.get_height()//2))
+
+    @classmethod
+    def preload(cls, **options):
+        super().preload(**options)
+        # Every card face
+        for value in range(1, cls.ROWS * cls.COLS // 2 + 1):
+            pin_text(get_font(36), str(value), (255, 255, 255))
+
+def run_memory():
+    run_game(Memory)
+
+# -------- Save journal --------
+SAVE_DIR = os.environ.get("GAME_HUB_SAVE_DIR", os.path.join(os.path.expanduser("~"), ".game_hub"))
+
+class Journal:
+    # Append-only save file: one JSON snapshot per line, written by a
+    # background thread so the frame loop never waits on the disk. Without
+    # threads, writes run as a spawn()ed task between frames (inline only if
+    # there is no event loop either). Every COMPACT_EVERY records the file is
+    # swapped for one holding just the latest.
+    COMPACT_EVERY = 200
+
+    def __init__(self, path):
+        self.path = path
+        self.records = 0
+        self.queue = queue.Queue()
+        self.thread = None
+        # Newest record waiting for the writer task
+        self.pending = None
+        self.writer = None
+        if THREADS:
+            self.thread = threading.Thread(target=self.run, name="journal", daemon=True)
+            self.thread.start()
+
+    def load(self):
+        # Latest complete record; a torn last line from a crash is skipped
+        try:
+            with open(self.path) as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return None
+        self.records = len(lines)
+        for line in reversed(lines):
+            try:
+                return json.loads(line)
+            except ValueError:
+                continue
+        return None
+
+    def append(self, record):
+        if self.thread:
+            self.queue.put(record)
+            return
+        self.pending = record
+        if self.writer is None:
+            self.writer = spawn(self.write_pending)
+            if self.writer is None:
+                self.flush()
+
+    async def write_pending(self):
+        self.flush()
+        self.writer = None
+
+    def flush(self):
+        # Records are full snapshots, so only the newest pending one matters
+        record, self.pending = self.pending, None
+        if record is not None:
+            self.save(record)
+
+    def close(self):
+        if self.thread:
+            self.queue.put(None)
+            self.thread.join()
+        else:
+            self.flush()
+
+    def run(self):
+        closing = False
+        while not closing:
+            batch = [self.queue.get()]
+            while not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            closing = None in batch
+            # Records are full snapshots, so only the newest pending one matters
+            records = [r for r in batch if r is not None]
+            if records:
+                self.save(records[-1])
+
+    def save(self, record):
+        try:
+            self.write(record)
+        except OSError as e:
+            print(f"Save failed: {e}", file=sys.stderr)
+
+    def write(self, record):
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        compact = self.records >= self.COMPACT_EVERY
+        target = self.path + ".tmp" if compact else self.path
+        with open(target, "w" if compact else "a") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        if compact:
+            os.replace(target, self.path)
+            self.records = 0
+        self.records += 1
+
+# -------- Clicker Game --------
+UPGRADE_RATE = Fraction(3, 2)  # Exact, so prices stay right at any size
+
+def bulk_cost(base, owned, n, rate=UPGRADE_RATE):
+    # The k-th upgrade costs base * rate^k, so n more after `owned` is a
+    # geometric series: base * rate^owned * (rate^n - 1) / (rate - 1),
+    # rounded down
+    return math.floor(base * rate ** owned * (rate ** n - 1) / (rate - 1))
+
+def log_fraction(q):
+    # math.log of a Fraction too large for a float
+    return math.log(q.numerator) - math.log(q.denominator)
+
+def max_affordable(base, owned, money, rate=UPGRADE_RATE):
+    # Invert the series for n with logs, then settle the boundary exactly
+    if bulk_cost(base, owned, 1, rate) > money: return 0
+    first = Fraction(base) * rate ** owned
+    n = max(1, int((log_fraction(money * (rate - 1) + first) - log_fraction(first)) / log_fraction(Fraction(rate))))
+    while bulk_cost(base, owned, n + 1, rate) <= money: n += 1
+    while n and bulk_cost(base, owned, n, rate) > money: n -= 1
+    return n
+
+def short_amount(n):
+    # Exact below a million, then three digits rounded down: "40.6B", "4.06e19"
+    if n < 10 ** 6: return str(n)
+    digits = str(n)
+    exp = len(digits) - 1
+    if exp >= 15: return f"{digits[0]}.{digits[1:3]}e{exp}"
+    whole = exp % 3 + 1
+    return digits[:whole] + ("." + digits[whole:3] if whole < 3 else "") + "MBT"[exp // 3 - 2]
+
+class Clicker(Game):
+    input_events = (pygame.MOUSEBUTTONDOWN,)
+    # Click money zone and upgrade buttons
+    click_zone = pygame.Rect(WIDTH//2 - 100, HEIGHT//2 - 50, 200, 100)
+    click_upgrade_btn = pygame.Rect(50, 100, 380, 60)
+    auto_clicker_btn = pygame.Rect(50, 180, 380, 60)
+    money_rect = pygame.Rect(50, 40, 700, 30)
+    stats_rect = pygame.Rect(50, 320, 700, 70)
+    notice_rect = pygame.Rect(50, 420, 700, 70)
+    sprites = (("rect", click_zone.w, click_zone.h, (0, 200, 255)),
+               ("rect", click_upgrade_btn.w, click_upgrade_btn.h, (50, 50, 100)),
+               ("rect", auto_clicker_btn.w, auto_clicker_btn.h, (50, 100, 50)))
+    CLICK_UPGRADE_BASE = 50
+    AUTO_CLICKER_BASE = 100
+    # Keys 1-4 pick how many upgrades a button press buys; None means max
+    BUY_AMOUNTS = {pygame.K_1: 1, pygame.K_2: 10, pygame.K_3: 100, pygame.K_4: None}
+
+    def __init__(self, seed=None, save_path=None, start=None):
+        super().__init__(seed)
+        self.font = get_font(36)
+        # `start` is a balance to begin from, as recorded for replays
+        self.money = 0
+        self.click_value = 1
+        self.auto_clickers = 0
+        if start:
+            self.money, self.click_value, self.auto_clickers = \
+                start["money"], start["click_value"], start["auto_clickers"]
+        self.buy_amount = 1
+        self.ticks = 0
+        self.notice = ""
+        self.unsaved = False
+        self.dirty = DirtyRects()
+        self.journal = Journal(save_path) if save_path else None
+        if self.journal:
+            self.resume(self.journal.load())
+
+    def resume(self, save):
+        if not save: return
+        self.money = save["money"]
+        self.click_value = save["click_value"]
+        self.auto_clickers = save["auto_clickers"]
+        # Auto-clickers earn 1 per second each, so the time away pays out in one step
+        away = max(0, int(time.time() - save["saved_at"]))
+        earned = self.auto_clickers * away
+        if earned:
+            self.money += earned
+            self.notice = f"Offline income: +${short_amount(earned)} ({away // 60}m {away % 60}s)"
+            self.after(4000, self.clear_notice)
+            self.unsaved = True
+
+    def clear_notice(self):
+        self.notice = ""
+        self.dirty.mark(self.notice_rect)
+
+    def save(self):
+        if self.journal and self.unsaved:
+            self.journal.append({"money": self.money, "click_value": self.click_value,
+                                 "auto_clickers": self.auto_clickers, "saved_at": time.time()})
+            self.unsaved = False
+
+    def close(self):
+        if self.journal:
+            self.save()
+            self.journal.close()
+
+    def quote(self, base, owned):
+        # (count, price) the button would buy right now
+        n = self.buy_amount or max(1, max_affordable(base, owned, self.money))
+        return n, bulk_cost(base, owned, n)
+
+    def buy(self, base, owned):
+        # Count bought, 0 if the quote is not affordable
+        n, cost = self.quote(base, owned)
+        if cost > self.money: return 0
+        self.money -= cost
+        return n
+
+    def update(self, inp):
+        for event in inp.events:
+            if event.type == pygame.KEYDOWN and event.key in self.BUY_AMOUNTS:
+                self.buy_amount = self.BUY_AMOUNTS[event.key]
+                self.dirty.mark_all()
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                mx, my = event.pos  # Mouse click position
+                if self.click_zone.collidepoint((mx, my)):
+                    self.earn(self.click_value)
+                elif self.click_upgrade_btn.collidepoint((mx, my)):
+                    bought = self.buy(self.CLICK_UPGRADE_BASE, self.click_value - 1)
+                    if bought:
+                        self.click_value += bought
+                        self.mark_purchase()
+                elif self.auto_clicker_btn.collidepoint((mx, my)):
+                    bought = self.buy(self.AUTO_CLICKER_BASE, self.auto_clickers)
+                    if bought:
+                        self.auto_clickers += bought
+                        self.mark_purchase()
+
+        # Auto-click income and autosave, once per second of game time
+        self.ticks += 1
+        if self.ticks % self.fps == 0:
+            if self.auto_clickers:
+                self.earn(self.auto_clickers)
+            self.save()
+        return True
+
+    def earn(self, amount):
+        self.money += amount
+        self.unsaved = True
+        self.dirty.mark(self.money_rect)
+        if self.buy_amount is None:
+            # "Max" quotes depend on the balance
+            self.dirty.mark(self.click_upgrade_btn)
+            self.dirty.mark(self.auto_clicker_btn)
+
+    def mark_purchase(self):
+        self.unsaved = True
+        self.dirty.mark(self.money_rect)
+        self.dirty.mark(self.click_upgrade_btn)
+        self.dirty.mark(self.auto_clicker_btn)
+        self.dirty.mark(self.stats_rect)
+
+    def draw(self, surface):
+        font = self.font
+        click_zone, click_upgrade_btn, auto_clicker_btn = self.click_zone, self.click_upgrade_btn, self.auto_clicker_btn
+        surface.fill((20, 20, 30))
+        surface.blit(atlas.get("rect", click_zone.w, click_zone.h, (0, 200, 255)), click_zone)
+        surface.blit(render_text(font, "CLICK", (255, 255, 255)), (click_zone.x + 50, click_zone.y + 35))
+
+        n, cost = self.quote(self.CLICK_UPGRADE_BASE, self.click_value - 1)
+        surface.blit(atlas.get("rect", click_upgrade_btn.w, click_upgrade_btn.h, (50, 50, 100)), click_upgrade_btn)
+        # Labels are cut at the button's edge, however long the quote
+        label_area = (0, 0, click_upgrade_btn.w - 20, click_upgrade_btn.h)
+        surface.blit(render_hud(font, f"Upgrade Click x{n} (${short_amount(cost)})", (255,255,255)),
+                     (click_upgrade_btn.x + 10, click_upgrade_btn.y + 10), label_area)
+
+        n, cost = self.quote(self.AUTO_CLICKER_BASE, self.auto_clickers)
+        surface.blit(atlas.get("rect", auto_clicker_btn.w, auto_clicker_btn.h, (50, 100, 50)), auto_clicker_btn)
+        surface.blit(render_hud(font, f"Auto-Clicker x{n} (${short_amount(cost)})", (255,255,255)),
+                     (auto_clicker_btn.x + 10, auto_clicker_btn.y + 10), label_area)
+
+        amount = "Max" if self.buy_amount is None else f"x{self.buy_amount}"
+        surface.blit(render_hud(font, f"Money: ${short_amount(self.money)}", (255,255,255)), (50, 40))
+        surface.blit(render_hud(font, f"Click Power: +{self.click_value}", (255,255,255)), (50, 320))
+        surface.blit(render_hud(font, f"Auto-Clickers: {self.auto_clickers}", (255,255,255)), (50, 360))
+        surface.blit(render_text(font, f"Buy {amount}  (1: x1, 2: x10, 3: x100, 4: Max)", (150,150,150)), (50, 420))
+        if self.notice:
+            surface.blit(render_text(font, self.notice, (255, 215, 0)), (50, 455))
+
+    @classmethod
+    def preload(cls, **options):
+        super().preload(**options)
+        pin_text(get_font(36), "CLICK", (255, 255, 255))
+
+    @classmethod
+    def live_options(cls):
+        return {"save_path": os.path.join(SAVE_DIR, "clicker.journal")}
+
+    def replay_options(self):
+        # The resumed balance, offline income included
+        return {"start": {"money": self.money, "click_value": self.click_value,
+                          "auto_clickers": self.auto_clickers}}
+
+def run_clicker():
+    run_game(Clicker)
+
+class Asteroids(Game):
+    sprites = (("rect", 30, 30, (0, 200, 200)), ("rect", 30, 30, (200, 200, 0)))
+
+    def __init__(self, seed=None, count=10, ramp=0.05):
+        super().__init__(seed)
+        self.player = pygame.Rect(WIDTH//2, HEIGHT - 50, 30, 30)
+        self.player_sprite = atlas.get("rect", 30, 30, (0, 200, 200))
+        self.asteroids = FallingObstacles(self.rng, count, 30, 4, (200, 200, 0))
+        self.ramp = ramp
+        self.ticks = 0
+        self.score = 0
+
+    def update(self, inp):
+        player = self.player
+        keys = inp.keys
+        if keys[pygame.K_LEFT] and player.left > 0: player.x -= 5
+        if keys[pygame.K_RIGHT] and player.right < WIDTH: player.x += 5
+        self.ticks += 1
+        if self.ramp and self.ticks % self.fps == 0:
+            asteroids = self.asteroids
+            asteroids.add(max(1, int(asteroids.count * self.ramp)), asteroids.speed * self.fps)
+        self.score += self.asteroids.advance()
+        return not self.asteroids.collides(player)
+
+    def draw(self, surface):
+        surface.fill((10, 10, 20))
+        surface.blit(self.player_sprite, self.player)
+        self.asteroids.draw(surface)
+        surface.blit(render_hud(font, f"Score: {self.score}", (255,255,255)), (10,10))
+
+def run_asteroids():
+    run_game(Asteroids)
+
+class GuessTheNumber(Game):
+    fps = 30
+    caption = "Guess the Number"
+    # KEYDOWN only carries the typed character while TEXTINPUT is enabled
+    input_events = (pygame.MOUSEBUTTONDOWN, pygame.TEXTINPUT)
+    button = pygame.Rect(WIDTH//2 - 80, HEIGHT//2 + 60, 160, 40)
+    txt_box = pygame.Rect(WIDTH//2 - 80, HEIGHT//2 - 30, 160, 40)
+    sprites = (("rect", txt_box.w, txt_box.h, None, (255, 255, 255)), ("rect", txt_box.w, txt_box.h, None, (0, 255, 0)),
+               ("rect", button.w, button.h, (0, 150, 150)))
+
+    def __init__(self, seed=None):
+        super().__init__(seed)
+        self.font = get_font(48)
+        self.input_font = get_font(36)
+        self.dirty = DirtyRects()
+        self.new_round()
+
+    def new_round(self):
+        self.target = self.rng.randint(1, 100)
+        self.guess = ""
+        self.result = "Enter a number between 1 and 100"
+        self.color = (255, 255, 255)
+        self.active = True
+        self.play_again = False
+
+    def update(self, inp):
+        if inp.events:
+            # Mostly static screen: repaint everything, but only after input
+            self.dirty.mark_all()
+        for event in inp.events:
+            if event.type == pygame.KEYDOWN and self.active:
+                if event.key == pygame.K_RETURN:
+                    if self.guess.isdigit():
+                        num = int(self.guess)
+                        if num < self.target:
+                            self.result = "Too low!"
+                        elif num > self.target:
+                            self.result = "Too high!"
+                        else:
+                            self.result = "Correct! 🎉"
+                            self.color = (0, 255, 0)
+                            self.active = False
+                            self.play_again = True
+                    else:
+                        self.result = "Enter digits only!"
+                    self.guess = ""
+                elif event.key == pygame.K_BACKSPACE:
+                    self.guess = self.guess[:-1]
+                else:
+                    if len(self.guess) < 3:
+                        self.guess += event.unicode
+            elif event.type == pygame.MOUSEBUTTONDOWN and self.play_again:
+                if self.button.collidepoint(event.pos):
+                    self.new_round()
+        return True
+
+    def draw(self, surface):
+        color, txt_box, button = self.color, self.txt_box, self.button
+        surface.fill((20, 20, 30))
+        surface.blit(atlas.get("rect", txt_box.w, txt_box.h, None, color), txt_box)
+        txt_surface = render_text(self.input_font, self.guess, color)
+        surface.blit(txt_surface, (txt_box.x + 10, txt_box.y + 5))
+
+        result_msg = render_text(self.font, self.result, color)
+        surface.blit(result_msg, (WIDTH//2 - result_msg.get_width()//2, HEIGHT//2 - 100))
+
+        if self.play_again:
+            surface.blit(atlas.get("rect", button.w, button.h, (0, 150, 150)), button)
+            btn_text = render_text(self.input_font, "Play Again", (255, 255, 255))
+            surface.blit(btn_text, (button.x + 20, button.y + 5))
+
+    @classmethod
+    def preload(cls, **options):
+        super().preload(**options)
+        pin_text(get_font(48), "Enter a number between 1 and 100", (255, 255, 255))
+        pin_text(get_font(36), "Play Again", (255, 255, 255))
+
+def run_guess_the_number():
+    run_game(GuessTheNumber)
+
+class GeometryDash(Game):
+    gravity = 0.8
+    jump_force = -12
+    ground_height = 40
+    ground_y = HEIGHT - ground_height
+    BLOCK, SPIKE = 0, 1
+    sprites = (("rect", 40, 40, (0, 255, 255)), ("rect", WIDTH, ground_height, (100, 100, 100)),
+               ("rect", 80, 20, (150, 150, 150)), ("spike", 30, 30, (255, 50, 50)))
+
+    def __init__(self, seed=None, level_length=5000, level=None):
+        super().__init__(seed)
+        self.font = get_font(36)
+        self.player = pygame.Rect(100, HEIGHT - 80, 40, 40)
+        self.velocity_y = 0
+        self.scroll_x = 0
+        self.score = 0
+        self.level_length = level_length
+        # Obstacles in world coordinates as pooled [x, y, w, h, kind] records,
+        # sorted by x: spawned at the right edge, retired once behind the camera
+        self.obstacle_pool = Pool(lambda: [0, 0, 0, 0, 0], 64)
+        self.obstacles = deque()
+        self.spawn_timer = 0
+        self.win = False
+        # A compiled level file replaces the random generator
+        self.level_path = level
+        self.level = open_level(level) if level else None
+        if self.level:
+            self.level_length = self.level.length
+            self.seek(0, 0)
+
+    def seek(self, x, record):
+        # Restart the run at world x, streaming the level from `record` on
+        while self.obstacles:
+            self.obstacle_pool.release(self.obstacles.popleft())
+        self.scroll_x = x
+        self.score = x // 6
+        self.player.bottom = self.ground_y
+        self.velocity_y = 0
+        self.stream = self.level.records(record)
+        self.upcoming = next(self.stream, None)
+
+    def stream_obstacles(self):
+        edge = self.scroll_x + WIDTH
+        while self.upcoming and self.upcoming[0] < edge:
+            self.spawn_obstacle(*self.upcoming)
+            self.upcoming = next(self.stream, None)
+
+    def crash(self):
+        # In a level with checkpoints, resume from the last one passed
+        checkpoint = self.level.checkpoint(self.scroll_x) if self.level else None
+        if checkpoint is None: return False
+        self.seek(*checkpoint)
+        self.stream_obstacles()
+        return True
+
+    def close(self):
+        if self.level: self.level.close()
+
+    def spawn_block(self, x):
+        y = self.rng.choice([self.ground_y - 60, self.ground_y - 80])  # Reachable only
+        self.spawn_obstacle(x, y, 80, 20, self.BLOCK)
+        # Add a spike below the platform at ground level, same x as block
+        self.spawn_obstacle(x + 25, self.ground_y - 30, 30, 30, self.SPIKE)
+
+    def spawn_floor_spike(self, x):
+        self.spawn_obstacle(x, self.ground_y - 30, 30, 30, self.SPIKE)
+
+    def spawn_obstacle(self, x, y, w, h, kind):
+        record = self.obstacle_pool.acquire()
+        record[:] = x, y, w, h, kind
+        self.obstacles.append(record)
+
+    def update(self, inp):
+        if self.win:
+            return True
+        player, ground_y, obstacles = self.player, self.ground_y, self.obstacles
+        for event in inp.events:
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_SPACE and self.velocity_y == 0:
+                    self.velocity_y = self.jump_force
+
+        self.spawn_timer += 1
+        if self.level:
+            self.stream_obstacles()
+        elif self.spawn_timer > 60:
+            x = WIDTH + self.scroll_x
+            r = self.rng.random()
+            if r < 0.6:
+                self.spawn_block(x)
+            elif r < 0.85:
+                self.spawn_floor_spike(x)
+            self.spawn_timer = 0
+
+        self.velocity_y += self.gravity
+        player.y += self.velocity_y
+
+        scroll_x = self.scroll_x
+        while obstacles and obstacles[0][0] + obstacles[0][2] <= scroll_x:
+            self.obstacle_pool.release(obstacles.popleft())
+
+        # Only obstacles starting left of the player's right edge can overlap it
+        reach = scroll_x + player.right
+        left, top, bottom = player.left, player.top, player.bottom
+        safe_landing = False
+        for x, y, w, h, kind in obstacles:
+            if x >= reach: break
+            if kind != self.BLOCK: continue
+            bx = x - scroll_x
+            if bx < player.right and left < bx + w and y < bottom and top < y + h:
+                if self.velocity_y > 0 and player.bottom <= y + 10:
+                    player.bottom = y
+                    self.velocity_y = 0
+                    safe_landing = True
+                else:
+                    return self.crash()
+
+        if player.bottom >= ground_y and not safe_landing:
+            player.bottom = ground_y
+            self.velocity_y = 0
+
+        top, bottom = player.top, player.bottom
+        for x, y, w, h, kind in obstacles:
+            if x >= reach: break
+            if kind != self.SPIKE: continue
+            sx = x - scroll_x
+            if sx < player.right and left < sx + w and y < bottom and top < y + h:
+                return self.crash()
+
+        self.scroll_x += 6
+        self.score += 1
+        if self.scroll_x > self.level_length:
+            self.win = True
+            self.after(3000, self.finish)
+        return True
+
+    def draw(self, surface):
+        surface.fill((30, 30, 30))
+        if self.win:
+            msg = render_text(self.font, "Level Complete!", (0, 255, 0))
+            surface.blit(msg, (WIDTH // 2 - msg.get_width() // 2, HEIGHT // 2))
+            return
+
+        scroll_x = self.scroll_x
+        batch = [(atlas.get("rect", 40, 40, (0, 255, 255)), self.player),
+                 (atlas.get("rect", WIDTH, self.ground_height, (100, 100, 100)), (0, self.ground_y)),
+                 (render_hud(self.font, f"Distance: {self.score}", (255, 255, 255)), (10, 10))]
+        for x, y, w, h, kind in self.obstacles:
+            sx = x - scroll_x
+            if sx >= WIDTH: break
+            if kind == self.BLOCK:
+                batch.append((atlas.get("rect", w, h, (150, 150, 150)), (sx, y)))
+            else:
+                batch.append((atlas.get("spike", w, h, (255, 50, 50)), (sx, y)))
+        surface.blits(batch, doreturn=False)
+
+    @classmethod
+    def preload(cls, level=None, **options):
+        super().preload(**options)
+        pin_text(get_font(36), "Level Complete!", (0, 255, 0))
+        if level and level not in preloaded_levels:
+            preloaded_levels[level] = LevelReader(level)
+
+    @classmethod
+    def live_options(cls):
+        # python game_hub.py --level FILE plays a compiled level
+        return {"level": arg_value("--level")}
+
+    def replay_options(self):
+        return {"level": os.path.abspath(self.level_path)} if self.level_path else {}
+
+# -------- Geometry Dash levels --------
+# Compiled levels: a header, a checkpoint table of (x, first record to load)
+# pairs, then fixed-size obstacle records sorted by x in chunks of
+# chunk_records. The reader maps the file and copies in one chunk at a time,
+# so memory does not grow with level length.
+LEVEL_MAGIC = b"GHLV"
+LEVEL_VERSION = 2
+LEVEL_HEADER = struct.Struct("<4sHHiII")  # magic, version, chunk_records, length, records, checkpoints
+LEVEL_CHECKPOINT = struct.Struct("<iI")
+LEVEL_RECORD = struct.Struct("<ihHHBx")  # x, y, w, h, kind
+LEVEL_KINDS = {"block": GeometryDash.BLOCK, "spike": GeometryDash.SPIKE}
+
+def parse_level(path):
+    # Text source: one entry per line, "#" starts a comment
+    #   block X Y [W H]     platform, 80x20 by default
+    #   spike X [Y W H]     30x30 on the ground by default
+    #   checkpoint X
+    #   length X            finish line, default: last obstacle + WIDTH
+    # JSON source: {"length": X, "checkpoints": [X, ...],
+    #   "obstacles": [{"kind": "block", "x": X, "y": Y, "w": W, "h": H}, ...]}
+    # Returns (length, obstacles as (x, y, w, h, kind), checkpoints)
+    ground = GeometryDash.ground_y
+    defaults = {"block": (None, 80, 20), "spike": (ground - 30, 30, 30)}
+    obstacles, checkpoints, length = [], [], None
+    with open(path) as f:
+        if path.endswith(".json"):
+            source = json.load(f)
+            length = source.get("length")
+            checkpoints = list(source.get("checkpoints", ()))
+            entries = [(o["kind"], o["x"], o.get("y"), o.get("w"), o.get("h")) for o in source.get("obstacles", ())]
+        else:
+            entries = []
+            for number, line in enumerate(f, 1):
+                words = line.split("#")[0].split()
+                if not words: continue
+                try:
+                    values = [int(v) for v in words[1:]]
+                except ValueError:
+                    raise ValueError(f"{path}:{number}: expected integers: {line.strip()}")
+                if words[0] == "checkpoint" and len(values) == 1:
+                    checkpoints.append(values[0])
+                elif words[0] == "length" and len(values) == 1:
+                    length = values[0]
+                elif words[0] in defaults and 1 <= len(values) <= 4:
+                    entries.append((words[0], *values, *[None] * (4 - len(values))))
+                else:
+                    raise ValueError(f"{path}:{number}: cannot parse: {line.strip()}")
+    for kind, x, y, w, h in entries:
+        if kind not in defaults:
+            raise ValueError(f"{path}: unknown obstacle kind {kind!r}")
+        dy, dw, dh = defaults[kind]
+        y, w, h = (dy if y is None else y), (dw if w is None else w), (dh if h is None else h)
+        if y is None:
+            raise ValueError(f"{path}: {kind} at x={x} needs a y")
+        obstacles.append((x, y, w, h, LEVEL_KINDS[kind]))
+    obstacles.sort()
+    if length is None:
+        length = max((x + w for x, _, w, _, _ in obstacles), default=0) + WIDTH
+    return length, obstacles, sorted(checkpoints)
+
+def compile_level(source, dest, chunk_records=256):
+    length, obstacles, checkpoints = parse_level(source)
+    with open(dest, "wb") as f:
+        f.write(LEVEL_HEADER.pack(LEVEL_MAGIC, LEVEL_VERSION, chunk_records, length,
+                                  len(obstacles), len(checkpoints)))
+        # First record that can still be on screen from each checkpoint on:
+        # everything before it ends at or behind the checkpoint. Checkpoints
+        # are sorted and that record only moves forward, so one merged pass
+        first = 0
+        for cp in checkpoints:
+            while first < len(obstacles) and obstacles[first][0] + obstacles[first][2] <= cp:
+                first += 1
+            f.write(LEVEL_CHECKPOINT.pack(cp, first))
+        for record in obstacles:
+            f.write(LEVEL_RECORD.pack(*record))
+    return len(obstacles)
+
+class LevelReader:
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.chunk_records, self.length, self.count, self.checkpoints = \
+            LEVEL_HEADER.unpack_from(self.map)
+        if magic != LEVEL_MAGIC:
+            raise ValueError(f"{path} is not a compiled level")
+        if version != LEVEL_VERSION:
+            raise ValueError(f"unsupported level version {version}")
+        self.records_at = LEVEL_HEADER.size + self.checkpoints * LEVEL_CHECKPOINT.size
+
+    def records(self, start=0):
+        # Records from index `start` on, one chunk in memory at a time
+        size, per_chunk = LEVEL_RECORD.size, self.chunk_records
+        while start < self.count:
+            end = min(self.count, (start // per_chunk + 1) * per_chunk)
+            yield from LEVEL_RECORD.iter_unpack(self.map[self.records_at + start * size:self.records_at + end * size])
+            start = end
+
+    def checkpoint(self, x):
+        # (x, first record) of the last checkpoint at or before x, by binary
+        # search over the mapped table; None before the first one
+        lo, hi = 0, self.checkpoints
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if LEVEL_CHECKPOINT.unpack_from(self.map, LEVEL_HEADER.size + mid * LEVEL_CHECKPOINT.size)[0] <= x:
+                lo = mid + 1
+            else:
+                hi = mid
+        if not lo: return None
+        return LEVEL_CHECKPOINT.unpack_from(self.map, LEVEL_HEADER.size + (lo - 1) * LEVEL_CHECKPOINT.size)
+
+    def close(self):
+        self.map.close()
+        self.file.close()
+
+# Levels opened by GeometryDash.preload(), handed over by open_level()
+preloaded_levels = {}
+
+def open_level(path):
+    return preloaded_levels.pop(path, None) or LevelReader(path)
+
+def run_geometry_dash():
+    run_game(GeometryDash)
+
+# Menu entries: (label, run function, Game class)
+GAMES = [("Snake", run_snake, Snake), ("Dodge", run_dodge, Dodge), ("Flapy", run_flappy, Flappy),
+         ("Break out", run_breakout, Breakout), ("Pong", run_pong, Pong), ("Memory", run_memory, Memory),
+         ("Clicker", run_clicker, Clicker), ("Asteroids", run_asteroids, Asteroids),
+         ("Quess the number", run_guess_the_number, GuessTheNumber),
+         ("Geometry dash", run_geometry_dash, GeometryDash)]  # Add more as we go
+
+# -------- Bots --------
+# Scripted players for soak runs, the benchmark and allocation checks: a
+# callable (game, tick) -> InputFrame per game class
+def snake_bot(game, tick):
+    # Greedy: step towards the apple, never into a wall or the body
+    y, x = divmod(game.snake[0], game.cols)
+    ay, ax = divmod(game.apple, game.cols) if game.apple is not None else (y, x)
+    moves = [(pygame.K_RIGHT, 1, 0), (pygame.K_LEFT, -1, 0), (pygame.K_DOWN, 0, 1), (pygame.K_UP, 0, -1)]
+    best = None
+    for key, dx, dy in moves:
+        nx, ny = x + dx, y + dy
+        if not (0 <= nx < game.cols and 0 <= ny < game.rows) or game.occupied[ny * game.cols + nx]:
+            continue
+        dist = abs(ax - nx) + abs(ay - ny)
+        if best is None or dist < best[0]:
+            best = (dist, key)
+    return key_press(best[1]) if best else IDLE
+
+def dodge_bot(game, tick):
+    # Sweep across the screen
+    return key_hold(pygame.K_LEFT if tick // 90 % 2 else pygame.K_RIGHT)
+
+def flappy_bot(game, tick):
+    if game.gravity > 0 and game.bird.centery > HEIGHT // 2:
+        return key_press(pygame.K_SPACE)
+    return IDLE
+
+def breakout_bot(game, tick):
+    if game.ball.centerx < game.paddle.centerx - 10: return key_hold(pygame.K_LEFT)
+    if game.ball.centerx > game.paddle.centerx + 10: return key_hold(pygame.K_RIGHT)
+    return IDLE
+
+def pong_bot(game, tick):
+    # Pick single player / medium, then track the ball with the left paddle
+    if game.phase == "mode": return key_press(pygame.K_1)
+    if game.phase == "difficulty": return key_press(pygame.K_2)
+    if game.ball.centery < game.player1.centery - 10: return key_hold(pygame.K_w)
+    if game.ball.centery > game.player1.centery + 10: return key_hold(pygame.K_s)
+    return IDLE
+
+def memory_bot(game, tick):
+    if tick % 10: return IDLE
+    return mouse_click(game.card_positions[tick // 10 % len(game.card_positions)].center)
+
+def clicker_bot(game, tick):
+    if tick % 120 == 60: return mouse_click(game.auto_clicker_btn.center)
+    if tick % 120 == 0: return mouse_click(game.click_upgrade_btn.center)
+    return mouse_click(game.click_zone.center)
+
+class GuessBot:
+    # Binary search, typing one character per frame
+    def __init__(self):
+        self.lo, self.hi, self.pending, self.last = 1, 100, [], None
+
+    def __call__(self, game, tick):
+        if game.play_again:
+            self.lo, self.hi, self.last = 1, 100, None
+            return mouse_click(game.button.center)
+        if self.pending:
+            return self.pending.pop(0)
+        if self.last is not None:
+            if game.result == "Too low!": self.lo = self.last + 1
+            elif game.result == "Too high!": self.hi = self.last - 1
+        self.last = (self.lo + self.hi) // 2
+        self.pending = [key_press(pygame.K_0 + int(c), c) for c in str(self.last)]
+        self.pending.append(key_press(pygame.K_RETURN))
+        return self.pending.pop(0)
+
+def geometry_dash_bot(game, tick):
+    for x, y, w, h, kind in game.obstacles:
+        if 140 < x - game.scroll_x < 200: return key_press(pygame.K_SPACE)
+    return IDLE
+
+BOTS = {Snake: snake_bot, Dodge: dodge_bot, Flappy: flappy_bot, Breakout: breakout_bot,
+        Pong: pong_bot, Memory: memory_bot, Clicker: clicker_bot, Asteroids: dodge_bot,
+        GuessTheNumber: GuessBot, GeometryDash: geometry_dash_bot}
+
+def make_bot(game_cls):
+    bot = BOTS[game_cls]
+    return bot() if isinstance(bot, type) else bot
+
+# Headless soak runs: python game_hub.py --headless snake [frames] [seed]
+# plays `frames` ticks with the game's bot, restarting it on the next seed
+# whenever it ends
+SIMULATIONS = {"snake": Snake, "dodge": Dodge, "flappy": Flappy, "breakout": Breakout, "pong": Pong,
+               "memory": Memory, "clicker": Clicker, "asteroids": Asteroids,
+               "guess": GuessTheNumber, "geometry_dash": GeometryDash}
+
+def headless_main(args):
+    name = args[0] if args else "snake"
+    frames = int(args[1]) if len(args) > 1 else 10000
+    seed = int(args[2]) if len(args) > 2 else 0
+    game_cls = SIMULATIONS[name]
+    scores = []
+    start = time.perf_counter()
+    game, bot = game_cls(seed), make_bot(game_cls)
+    for tick in range(frames):
+        if not game.step(bot(game, tick)):
+            scores.append(getattr(game, "score", 0))
+            game, bot = game_cls(seed + len(scores)), make_bot(game_cls)
+    elapsed = time.perf_counter() - start
+    report = f"{name}: {frames} ticks in {elapsed * 1000:.0f} ms ({frames / elapsed:.0f} ticks/s), {len(scores)} games over"
+    if hasattr(game, "score"):
+        scores.append(game.score)
+        report += f", mean score {sum(scores) / len(scores):.2f}, best {max(scores):.2f}"
+    print(report)
+
+record_timing("startup_ms", START_TIME)
+
+# Flags followed by a value
+VALUE_FLAGS = ("--trace", "--record", "--replay", "--level", "--compile-level", "--render-scale", "--scaler")
+
+def positional_args():
+    args, skip = [], False
+    for a in sys.argv[1:]:
+        if skip: skip = False
+        elif a in VALUE_FLAGS: skip = True
+        elif not a.startswith("--"): args.append(a)
+    return args
+
+if __name__ == "__main__":
+    replay_path = arg_value("--replay")
+    level_source = arg_value("--compile-level")
+    if level_source:
+        # python game_hub.py --compile-level SOURCE [OUT]
+        args = positional_args()
+        out = args[0] if args else os.path.splitext(level_source)[0] + ".ghl"
+        print(f"{out}: {compile_level(level_source, out)} obstacles")
+    elif replay_path:
+        # python game_hub.py --replay FILE [--realtime]; add --headless to fast-forward
+        for name, ticks, game in replay(replay_path, realtime="--realtime" in sys.argv and not HEADLESS):
+            print(f"{name}: {ticks} frames, score {getattr(game, 'score', 0)}")
+    elif HEADLESS:
+        headless_main(positional_args())
+    elif BROWSER or "--async" in sys.argv:
+        asyncio.run(main_menu_async())
+    else:
+        main_menu()
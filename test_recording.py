@@ -0,0 +1,92 @@
+# Record -> replay round trips: python -m pytest test_recording.py
+import os
+import math
+from fractions import Fraction
+
+os.environ["GAME_HUB_HEADLESS"] = "1"
+import pygame
+import game_hub as hub
+
+LEVEL_SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "levels", "intro.txt")
+
+def play_live(game_cls, frames, press, **options):
+    # Drive game_loop as a live session, posting `press(frame)` keys to the
+    # event queue; returns the game it ended with
+    loop = hub.game_loop(game_cls, 1234, **options)
+    try:
+        next(loop)
+        for frame in range(frames):
+            key = press(frame)
+            if key: pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, unicode=""))
+            next(loop)
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+        next(loop)
+    except StopIteration as stop:
+        return stop.value
+    raise AssertionError("game did not quit")
+
+def test_level_session_replays_on_the_same_level(tmp_path, monkeypatch):
+    level = str(tmp_path / "intro.ghl")
+    hub.compile_level(LEVEL_SOURCE, level)
+    recording = str(tmp_path / "session.ghr")
+    monkeypatch.setattr(hub, "recorder", hub.InputRecorder(recording))
+    live = play_live(hub.GeometryDash, 600, lambda frame: pygame.K_SPACE if frame % 37 == 0 else None, level=level)
+    assert live.level is not None
+
+    (name, ticks, game), = hub.replay(recording)
+    assert name == "GeometryDash"
+    assert game.level is not None and game.level_length == live.level_length
+    assert (game.score, game.scroll_x, game.player.y) == (live.score, live.scroll_x, live.player.y)
+
+def test_truncated_log_yields_complete_frames(tmp_path):
+    # Every prefix of a log, as left by a crash at any byte, decodes to a
+    # prefix of each session's frames
+    path = str(tmp_path / "full.ghr")
+    recorder = hub.InputRecorder(path)
+    for session in range(2):
+        recorder.start(hub.GuessTheNumber(session), session)
+        for i in range(40):
+            events = []
+            if i % 3 == 0: events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, unicode="é"))
+            if i % 7 == 0: events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(i, i + 1), button=1))
+            recorder.record(hub.InputFrame(events, hub.HeldKeys([pygame.K_LEFT] if i % 5 else []), (i, 2 * i)))
+        recorder.stop()
+    with open(path, "rb") as f:
+        data = f.read()
+    full = [frames for _, _, _, frames in hub.read_recording(path)]
+    assert [len(frames) for frames in full] == [40, 40]
+
+    cut_path = str(tmp_path / "cut.ghr")
+    for cut in range(len(data)):
+        with open(cut_path, "wb") as f:
+            f.write(data[:cut])
+        sessions = [frames for _, _, _, frames in hub.read_recording(cut_path)]
+        assert len(sessions) <= 2
+        for frames, original in zip(sessions, full):
+            assert frames == original[:len(frames)], f"cut at byte {cut}"
+
+def item_price(base, k):
+    # The k-th upgrade alone, exactly: base * 1.5^k
+    return Fraction(base * 3 ** k, 2 ** k)
+
+def test_max_affordable_matches_buying_one_at_a_time():
+    for base in (1, 7, 50, 100):
+        for owned in (0, 1, 5, 20, 60):
+            for money in (0, 1, base - 1, base, 10 ** 3, 12345, 10 ** 9, 10 ** 15, 10 ** 30):
+                n, spent = 0, 0
+                while math.floor(spent + item_price(base, owned + n)) <= money:
+                    spent += item_price(base, owned + n)
+                    n += 1
+                assert hub.max_affordable(base, owned, money) == n, (base, owned, money)
+
+def test_single_upgrade_cost_follows_the_sequence():
+    for base in (1, 50, 100):
+        for k in range(200):
+            assert hub.bulk_cost(base, k, 1) == base * 3 ** k // 2 ** k
+
+def test_short_amount_keeps_labels_short():
+    assert hub.short_amount(999999) == "999999"
+    assert hub.short_amount(1234567) == "1.23M"
+    assert hub.short_amount(40656117753) == "40.6B"
+    assert hub.short_amount(999999999999999) == "999T"
+    assert hub.short_amount(40656117753521520640) == "4.06e19"
@@ -0,0 +1,59 @@
+# Calibrates Pong's AI difficulties by headless self-play:
+#   python tune_pong.py [--matches 200] [--workers N] [--points 10]
+# The computer (right paddle) plays a predictive opponent moving at the
+# human paddle speed. For each difficulty, the AI speed is bisected until the
+# computer's win rate hits the target. Matches run across a process pool.
+import os, sys, argparse
+from concurrent.futures import ProcessPoolExecutor
+
+os.environ["GAME_HUB_HEADLESS"] = "1"
+# Keep the pygame banner out of the results printed to stdout
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import game_hub as hub
+
+TARGETS = [("1. Easy", 0.25), ("2. Medium", 0.50), ("3. Hard", 0.75), ("4. Impossible", 0.95)]
+MAX_TICKS = 200_000
+
+def play_match(job):
+    # Returns 1 if the computer wins, 0 otherwise
+    seed, ai_speed, points = job
+    game = hub.Pong(seed, single_player=True, ai_speed=ai_speed, left_ai_speed=hub.Pong.PADDLE_SPEED)
+    game.WINNING_SCORE = points
+    for _ in range(MAX_TICKS):
+        game.step(hub.IDLE)
+        if game.winner: break
+    return 1 if game.score2 > game.score1 else 0
+
+def win_rate(pool, ai_speed, matches, points, seed):
+    jobs = [(seed + i, ai_speed, points) for i in range(matches)]
+    return sum(pool.map(play_match, jobs, chunksize=max(1, matches // 32))) / matches
+
+def calibrate(pool, target, matches, points, lo=1.0, hi=16.0, steps=8):
+    # Win rate grows with paddle speed, so bisect on it
+    for step in range(steps):
+        mid = (lo + hi) / 2
+        rate = win_rate(pool, mid, matches, points, seed=step * matches)
+        print(f"  speed {mid:5.2f}: {rate:.0%}", file=sys.stderr)
+        if rate < target: lo = mid
+        else: hi = mid
+    return round((lo + hi) / 2, 1)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Calibrate Pong AI difficulties by self-play")
+    parser.add_argument("--matches", type=int, default=200, help="matches per evaluated speed")
+    parser.add_argument("--points", type=int, default=hub.Pong.WINNING_SCORE)
+    parser.add_argument("--steps", type=int, default=8, help="bisection steps per difficulty")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    table = []
+    with ProcessPoolExecutor(args.workers) as pool:
+        for label, target in TARGETS:
+            print(f"{label} (target {target:.0%})", file=sys.stderr)
+            table.append((label, calibrate(pool, target, args.matches, args.points, steps=args.steps)))
+    print("DIFFICULTIES = [")
+    print(",\n".join(f"    ({label!r}, {speed})" for label, speed in table).replace("'", '"'))
+    print("]")
+
+if __name__ == "__main__":
+    main()